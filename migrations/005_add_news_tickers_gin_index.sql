@@ -0,0 +1,6 @@
+-- GIN index on the tickers array so "tickers @> ARRAY[...]" predicates
+-- (article selection, search_news) use an index instead of a seq scan + unnest.
+-- CONCURRENTLY avoids blocking ingestion writes (here and in 006); run
+-- outside a transaction.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_tickers_gin
+ON news_raw USING GIN (tickers);
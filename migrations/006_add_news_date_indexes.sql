@@ -0,0 +1,8 @@
+-- Range indexes for the date-window filters on news_raw:
+--   article selection:  source = 'finance.yahoo.com' AND published_date_utc in [start, end)
+--   search_news:        published_utc BETWEEN start AND end
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_source_pub_date
+ON news_raw (source, published_date_utc);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_published_utc
+ON news_raw (published_utc);
@@ -3,11 +3,14 @@
 Earnings Impact Analyst Agent
 Analyzes earnings calls and generates investment briefs.
 """
-from typing import TypedDict, Annotated, List, Dict, Optional
+from typing import List, Dict, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
 
 
-class AgentState(TypedDict):
+@dataclass(slots=True)
+class AgentState:
     """
     State tracked by the agent throughout analysis.
     This is the agent's "working memory".
@@ -16,76 +19,102 @@ class AgentState(TypedDict):
     call_id: str
 
     # Call metadata
-    ticker: str
-    fiscal_quarter: str
-    fiscal_year: int
-    call_date: str
-    call_start_utc: datetime
+    call: Optional[Dict] = None                 # get_earnings_call() row, loaded once per run
+    ticker: str = ""
+    fiscal_quarter: str = ""
+    fiscal_year: int = 0
+    call_date: str = ""
+    call_start_utc: Optional[datetime] = None
 
     # Content from database
-    prepared_remarks: List[Dict]
-    qa_section: List[Dict]
-    news_pre_call: List[Dict]
-    news_post_call: List[Dict]
+    prepared_remarks: List[Dict] = field(default_factory=list)
+    qa_section: List[Dict] = field(default_factory=list)
+    news_pre_call: List[Dict] = field(default_factory=list)
+    news_pre_call_window: List[Dict] = field(default_factory=list)  # Whole pre-call window (ranking input)
+    news_post_call: List[Dict] = field(default_factory=list)
 
     # Market data
-    stock_prices: List[Dict]              # Event-window prices (during call)
-    pre_event_analysis: Optional[Dict]    # Pre-event analysis
+    stock_prices: List[Dict] = field(default_factory=list)  # Event-window prices (during call)
+    event_reaction: Optional[Dict] = None       # {'first', 'last', 'pct'} over the event window
+    pre_event_analysis: Optional[Dict] = None   # Pre-event analysis
 
     # Analysis results (populated by LLM)
-    key_metrics: Optional[Dict]
-    management_tone: Optional[str]
-    analyst_concerns: Optional[List[str]]
-    market_reaction: Optional[Dict]
+    key_metrics: Optional[Dict] = None
+    management_tone: Optional[str] = None
+    analyst_concerns: Optional[List[str]] = None
+    market_reaction: Optional[Dict] = None
 
     # Final output
-    report: Optional[str]
+    report: Optional[str] = None
 
     # Control flow
-    current_step: str
-    errors: List[str]
+    current_step: str = "start"
+    errors: List[str] = field(default_factory=list)
+    verbose: bool = True                        # Print progress from each node
 
 
-def create_initial_state(call_id: str) -> AgentState:
+def create_initial_state(
+    call_id: str,
+    verbose: bool = True,
+    call: Optional[Dict] = None
+) -> AgentState:
     """
     Create initial agent state with just the call_id.
     All other fields will be populated as the agent runs.
+    
+    Pass call (a get_earnings_call() row) if it is already loaded.
     """
-    return AgentState(
-        call_id=call_id,
-        ticker="",
-        fiscal_quarter="",
-        fiscal_year=0,
-        call_date="",
-        call_start_utc=None,
-        prepared_remarks=[],
-        qa_section=[],
-        news_pre_call=[],
-        news_post_call=[],
-        stock_prices=[],
-        pre_event_analysis=None,
-        key_metrics=None,
-        management_tone=None,
-        analyst_concerns=None,
-        market_reaction=None,
-        report=None,
-        current_step="start",
-        errors=[]
-    )
+    return AgentState(call_id=call_id, verbose=verbose, call=call)
 
 # Add these imports at the top
 from aifinreport.tools.database_tools import (
     get_earnings_call,
+    get_earnings_calls,
     get_prepared_remarks,
     get_qa_section,
-    search_news_around_call
+    search_news_around_call,
+    search_news_around_call_multi
 )
 from aifinreport.tools.market_data_tools import fetch_ohlc_bars
+from aifinreport.agents.news_ranker import rank_articles_by_relevance
 from datetime import timedelta
 
 
+def _say(verbose: bool, msg: str) -> None:
+    """Print progress output unless the run is quiet (batch / library use)."""
+    if verbose:
+        print(msg)
+
+
 # Helper Functions for Pre-Event Analysis
 
+# Pre-event analysis configuration (hardcoded defaults for now)
+PRE_EVENT_LOOKBACK_DAYS = 14
+PRE_EVENT_TOP_N_NEWS = 10
+
+# Window offsets, built once
+_PR_FALLBACK_OFFSET = timedelta(minutes=30)   # Estimated PR time before call start
+_PRE_EVENT_LOOKBACK = timedelta(days=PRE_EVENT_LOOKBACK_DAYS)
+_EVENT_PRE = timedelta(hours=1)                # Event window: 1h before call start
+_EVENT_POST = timedelta(hours=3)               # ... to 3h after
+
+
+def _pre_event_period(call_metadata: Dict) -> tuple:
+    """
+    Return (pr_time, period_start, period_end) for the pre-event window.
+    
+    Uses the press release time if known, else 30 minutes before the call.
+    """
+    pr_time = call_metadata.get('press_release_time_utc')
+    if not pr_time:
+        pr_time = call_metadata['call_start_utc'] - _PR_FALLBACK_OFFSET
+    return pr_time, pr_time - _PRE_EVENT_LOOKBACK, pr_time
+
+
+def _event_window(call_start_utc: datetime) -> tuple:
+    """Return (start, end) of the intraday window around the call."""
+    return call_start_utc - _EVENT_PRE, call_start_utc + _EVENT_POST
+
 def calculate_return(bars: List[Dict]) -> float:
     """Calculate total return from price bars."""
     if not bars or len(bars) < 2:
@@ -97,13 +126,22 @@ def calculate_return(bars: List[Dict]) -> float:
     return (end_price - start_price) / start_price
 
 
-def analyze_pre_event(call_id: str, call_metadata: Dict) -> Dict:
+def analyze_pre_event(
+    call_id: str,
+    call_metadata: Dict,
+    news_pre_call: Optional[List[Dict]] = None,
+    ticker_bars: Optional[List[Dict]] = None,
+    verbose: bool = True
+) -> Dict:
     """
     Analyze market setup before earnings release.
     
     Uses actual press release time from database if available,
     otherwise assumes 30 minutes before call.
     
+    Pass already-loaded pre-call news as news_pre_call, and/or the daily
+    bars for the pre-event period as ticker_bars, to skip those fetches.
+    
     Returns:
         {
             'pr_time': datetime,
@@ -115,53 +153,57 @@ def analyze_pre_event(call_id: str, call_metadata: Dict) -> Dict:
             }
         }
     """
-    # Configuration (hardcoded defaults for now)
-    LOOKBACK_DAYS = 14
-    TOP_N_NEWS = 10
-    
-    # Step 1: Get press release time (from DB or estimate)
-    pr_time = call_metadata.get('press_release_time_utc')
-    if not pr_time:
+    # Step 1 + 2: Press release time (from DB or estimate) and analysis period
+    pr_time, period_start, period_end = _pre_event_period(call_metadata)
+    if not call_metadata.get('press_release_time_utc'):
         # Fallback: assume 30 min before call
-        pr_time = call_metadata['call_start_utc'] - timedelta(minutes=30)
-        print(f"   ⚠️  Using estimated PR time (30 min before call)")
+        _say(verbose, f"   ⚠️  Using estimated PR time (30 min before call)")
     
-    print(f"   Press Release: {pr_time} UTC")
+    _say(verbose, f"   Press Release: {pr_time} UTC")
     
-    # Step 2: Define analysis period
-    period_start = pr_time - timedelta(days=LOOKBACK_DAYS)
-    period_end = pr_time
-    
-    print(f"   Lookback Period: {LOOKBACK_DAYS} days")
-    print(f"   Analysis Period: {period_start.date()} → {period_end.date()}")
+    _say(verbose, f"   Lookback Period: {PRE_EVENT_LOOKBACK_DAYS} days")
+    _say(verbose, f"   Analysis Period: {period_start.date()} → {period_end.date()}")
     
     # Step 3: Get relevant news
-    all_news = search_news_around_call(call_id, "pre-call")
-    # TODO: Implement ranking by relevance
-    # For now, just take first N
-    relevant_news = all_news[:TOP_N_NEWS]
+    if news_pre_call is None:
+        news_pre_call = search_news_around_call(call_id, "pre-call")
+    all_news = news_pre_call
+    try:
+        # One batched embedding pass over all articles + a single query vector
+        relevant_news = rank_articles_by_relevance(
+            all_news,
+            call_metadata['ticker'],
+            call_metadata.get('fiscal_quarter', ""),
+            top_n=PRE_EVENT_TOP_N_NEWS,
+            verbose=verbose
+        )
+    except Exception as e:
+        # Model not installed / not downloadable: keep most recent first
+        _say(verbose, f"   ⚠️  Embedding model unavailable ({e}), using most recent news")
+        relevant_news = all_news[:PRE_EVENT_TOP_N_NEWS]
     
-    print(f"   News Articles: {len(relevant_news)} relevant")
+    _say(verbose, f"   News Articles: {len(relevant_news)} relevant")
     
     # Step 4: Fetch stock prices
-    ticker_bars = fetch_ohlc_bars(
-        call_metadata['ticker'],
-        period_start,
-        period_end,
-        "1day"
-    )
+    if ticker_bars is None:
+        ticker_bars = fetch_ohlc_bars(
+            call_metadata['ticker'],
+            period_start,
+            period_end,
+            "1day"
+        )
     
-    print(f"   Price Bars: {len(ticker_bars)} daily bars")
+    _say(verbose, f"   Price Bars: {len(ticker_bars)} daily bars")
     
     # Step 5: Calculate returns
     ticker_return = calculate_return(ticker_bars)
     
-    print(f"   Stock Performance: {call_metadata['ticker']} {ticker_return*100:+.2f}%")
+    _say(verbose, f"   Stock Performance: {call_metadata['ticker']} {ticker_return*100:+.2f}%")
     
     # Step 6: Package results
     return {
         'pr_time': pr_time,
-        'lookback_days': LOOKBACK_DAYS,
+        'lookback_days': PRE_EVENT_LOOKBACK_DAYS,
         'period': {
             'start': period_start,
             'end': period_end
@@ -185,28 +227,29 @@ def load_call_info(state: AgentState) -> AgentState:
     """
     Load earnings call metadata from database.
     """
-    print(f"\n📋 Loading call info for {state['call_id']}...")
+    _say(state.verbose, f"\n📋 Loading call info for {state.call_id}...")
 
     try:
-        call = get_earnings_call(state['call_id'])
+        call = state.call or get_earnings_call(state.call_id)
 
-        state['ticker'] = call['ticker']
-        state['fiscal_quarter'] = call['fiscal_quarter']
-        state['fiscal_year'] = call['fiscal_year']
-        state['call_date'] = call['call_date']
-        state['call_start_utc'] = call['call_start_utc']
-        state['current_step'] = "load_content"
+        state.call = call
+        state.ticker = call['ticker']
+        state.fiscal_quarter = call['fiscal_quarter']
+        state.fiscal_year = call['fiscal_year']
+        state.call_date = call['call_date']
+        state.call_start_utc = call['call_start_utc']
+        state.current_step = "load_content"
 
-        print(f"✅ Loaded: {call['ticker']} {call['fiscal_quarter']} {call['fiscal_year']}")
+        _say(state.verbose, f"✅ Loaded: {call['ticker']} {call['fiscal_quarter']} {call['fiscal_year']}")
         
         # Show PR time if available
         if call.get('press_release_time_utc'):
-            print(f"   Press Release: {call['press_release_time_utc']} UTC")
-            print(f"   Call Start: {call['call_start_utc']} UTC")
+            _say(state.verbose, f"   Press Release: {call['press_release_time_utc']} UTC")
+            _say(state.verbose, f"   Call Start: {call['call_start_utc']} UTC")
 
     except Exception as e:
-        state['errors'].append(f"Failed to load call info: {e}")
-        state['current_step'] = "error"
+        state.errors.append(f"Failed to load call info: {e}")
+        state.current_step = "error"
 
     return state
 
@@ -216,86 +259,152 @@ def load_content(state: AgentState) -> AgentState:
     """
     Load prepared remarks, Q&A, and news from database.
     """
-    print(f"\n📚 Loading content...")
-
-    try:
-        # Get prepared remarks
-        state['prepared_remarks'] = get_prepared_remarks(state['call_id'])
-        print(f"✅ Loaded {len(state['prepared_remarks'])} prepared remarks")
-
-        # Get Q&A
-        state['qa_section'] = get_qa_section(state['call_id'])
-        print(f"✅ Loaded {len(state['qa_section'])} Q&A interventions")
-
-        # Get pre-call news
-        state['news_pre_call'] = search_news_around_call(
-            state['call_id'],
-            time_window="pre-call",
-            limit=20
-        )
-        print(f"✅ Loaded {len(state['news_pre_call'])} pre-call news articles")
-
-        # Get post-call news
-        state['news_post_call'] = search_news_around_call(
-            state['call_id'],
-            time_window="post-24h",
-            limit=20
-        )
-        print(f"✅ Loaded {len(state['news_post_call'])} post-call news articles")
+    _say(state.verbose, f"\n📚 Loading content...")
+
+    call_id = state.call_id
+
+    # The fetches are independent DB round trips: run them concurrently.
+    # Both news windows come back from a single query; the pre-call window is
+    # fetched whole so relevance ranking sees older articles too.
+    # name -> (fetcher, args, label)
+    jobs = {
+        'prepared_remarks': (get_prepared_remarks, (), "prepared remarks"),
+        'qa_section': (get_qa_section, (), "Q&A interventions"),
+        'news': (search_news_around_call_multi,
+                 ([("pre-call", None), ("post-24h", 20)],), "news articles"),
+    }
 
-        state['current_step'] = "fetch_prices"
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        futures = {
+            key: ex.submit(fn, call_id, *args, call=state.call)
+            for key, (fn, args, _) in jobs.items()
+        }
 
-    except Exception as e:
-        state['errors'].append(f"Failed to load content: {e}")
-        state['current_step'] = "error"
+    # Collect in a fixed order; one failing fetch doesn't discard the others
+    failed = False
+    for key, future in futures.items():
+        label = jobs[key][2]
+        try:
+            result = future.result()
+        except Exception as e:
+            state.errors.append(f"Failed to load {label}: {e}")
+            failed = True
+            continue
+
+        if key == 'news':
+            state.news_pre_call_window = result["pre-call"]
+            state.news_pre_call = result["pre-call"][:20]
+            state.news_post_call = result["post-24h"]
+            _say(state.verbose, f"✅ Loaded {len(state.news_pre_call)} pre-call news articles")
+            _say(state.verbose, f"✅ Loaded {len(state.news_post_call)} post-call news articles")
+        else:
+            setattr(state, key, result)
+            _say(state.verbose, f"✅ Loaded {len(result)} {label}")
+
+    state.current_step = "error" if failed else "fetch_prices"
 
     return state
 
 
 # Node 3: Fetch Prices
-def fetch_prices(state: AgentState) -> AgentState:
+def _call_metadata(state: AgentState) -> Dict:
+    """Metadata needed for price windows (PR time comes from the loaded call)."""
+    call = state.call or {}
+    return {
+        'ticker': state.ticker,
+        'fiscal_quarter': state.fiscal_quarter,
+        'call_start_utc': state.call_start_utc,
+        'press_release_time_utc': call.get('press_release_time_utc')  # Use actual PR time
+    }
+
+
+def prefetch_prices(state: AgentState, executor: ThreadPoolExecutor) -> Dict[str, Future]:
+    """
+    Start both OHLC requests on executor as soon as the call metadata is known.
+    
+    They don't depend on the DB content, so they can run while load_content
+    does. Pass the result to fetch_prices(state, prefetched=...).
+    
+    Returns:
+        {'pre_event': Future[daily bars], 'event': Future[5-min bars]}
+    """
+    _, period_start, period_end = _pre_event_period(_call_metadata(state))
+    event_start, event_end = _event_window(state.call_start_utc)
+    return {
+        'pre_event': executor.submit(
+            fetch_ohlc_bars, state.ticker, period_start, period_end, "1day"
+        ),
+        'event': executor.submit(
+            fetch_ohlc_bars,
+            ticker=state.ticker,
+            start_time=event_start,
+            end_time=event_end,
+            interval="5min"
+        ),
+    }
+
+
+def fetch_prices(
+    state: AgentState,
+    prefetched: Optional[Dict[str, Future]] = None
+) -> AgentState:
     """
     Fetch stock prices - includes pre-event analysis.
+    
+    If prefetched (from prefetch_prices) is given, the bars are taken from
+    those futures instead of being requested here.
     """
-    print(f"\n📈 Fetching stock prices...")
+    _say(state.verbose, f"\n📈 Fetching stock prices...")
 
     try:
-        # Get call data from database (includes PR time now)
-        call = get_earnings_call(state['call_id'])
+        # Get call data (includes PR time, loaded by load_call_info)
+        call_metadata = _call_metadata(state)
         
         # Pre-event analysis
-        print(f"\n📊 Pre-Event Analysis:")
-        call_metadata = {
-            'ticker': state['ticker'],
-            'call_start_utc': state['call_start_utc'],
-            'press_release_time_utc': call.get('press_release_time_utc')  # Use actual PR time
-        }
+        _say(state.verbose, f"\n📊 Pre-Event Analysis:")
         
-        state['pre_event_analysis'] = analyze_pre_event(state['call_id'], call_metadata)
+        # Rank the whole pre-call window from load_content instead of querying again
+        state.pre_event_analysis = analyze_pre_event(
+            state.call_id, call_metadata,
+            news_pre_call=state.news_pre_call_window,
+            ticker_bars=prefetched['pre_event'].result() if prefetched else None,
+            verbose=state.verbose
+        )
         
         # Event-window prices (during call)
-        print(f"\n📞 Event-Window Prices:")
-        bars = fetch_ohlc_bars(
-            ticker=state['ticker'],
-            start_time=state['call_start_utc'] - timedelta(hours=1),
-            end_time=state['call_start_utc'] + timedelta(hours=3),
-            interval="5min"
-        )
-
-        state['stock_prices'] = bars
-        print(f"✅ Fetched {len(bars)} price bars during call")
+        _say(state.verbose, f"\n📞 Event-Window Prices:")
+        if prefetched:
+            bars = prefetched['event'].result()
+        else:
+            event_start, event_end = _event_window(state.call_start_utc)
+            bars = fetch_ohlc_bars(
+                ticker=state.ticker,
+                start_time=event_start,
+                end_time=event_end,
+                interval="5min"
+            )
+
+        state.stock_prices = bars
+        _say(state.verbose, f"✅ Fetched {len(bars)} price bars during call")
 
         if bars:
-            price_change = bars[-1]['close'] - bars[0]['close']
-            price_change_pct = (price_change / bars[0]['close']) * 100
-            print(f"   Price movement: ${bars[0]['close']:.2f} → ${bars[-1]['close']:.2f} ({price_change_pct:+.2f}%)")
+            first_price = bars[0]['close']
+            last_price = bars[-1]['close']
+            price_change_pct = ((last_price - first_price) / first_price) * 100
+            # Kept for generate_report so it doesn't re-derive from the bars
+            state.event_reaction = {
+                'first': first_price,
+                'last': last_price,
+                'pct': price_change_pct,
+            }
+            _say(state.verbose, f"   Price movement: ${first_price:.2f} → ${last_price:.2f} ({price_change_pct:+.2f}%)")
 
-        state['current_step'] = "analyze"
+        state.current_step = "analyze"
 
     except Exception as e:
-        state['errors'].append(f"Failed to fetch prices: {e}")
+        state.errors.append(f"Failed to fetch prices: {e}")
         # Non-critical, continue anyway
-        state['current_step'] = "analyze"
+        state.current_step = "analyze"
 
     return state
 
@@ -306,29 +415,38 @@ def analyze(state: AgentState) -> AgentState:
     Analyze all data and generate insights.
     This is where LLM analysis will happen.
     """
-    print(f"\n🤖 Analyzing data...")
+    _say(state.verbose, f"\n🤖 Analyzing data...")
 
     # For now, just placeholder
-    state['key_metrics'] = {"status": "Analysis pending - LLM integration next"}
-    state['current_step'] = "generate_report"
+    state.key_metrics = {"status": "Analysis pending - LLM integration next"}
+    state.current_step = "generate_report"
 
     return state
 
 
 # Node 5: Generate Report
+NEXT_STEPS_SECTION = """## Next Steps
+- LLM analysis to extract key metrics
+- Sentiment analysis of Q&A themes
+- Correlation of price movement with call content
+- Generate actionable investment insights
+"""
+
+
 def generate_report(state: AgentState) -> AgentState:
     """
     Generate final markdown report.
     """
-    print(f"\n📝 Generating report...")
+    _say(state.verbose, f"\n📝 Generating report...")
 
     # Build report with pre-event analysis
-    pre = state.get('pre_event_analysis', {})
+    pre = state.pre_event_analysis or {}
     
-    report = f"""# {state['ticker']} {state['fiscal_quarter']} FY{state['fiscal_year']} Earnings Analysis
+    # Sections are collected and joined once at the end
+    sections: List[str] = [f"""# {state.ticker} {state.fiscal_quarter} FY{state.fiscal_year} Earnings Analysis
 
 ## Pre-Event Setup
-"""
+"""]
     
     if pre:
         pr_time = pre.get('pr_time')
@@ -336,7 +454,7 @@ def generate_report(state: AgentState) -> AgentState:
         period_start = pre['period']['start']
         period_end = pre['period']['end']
         
-        report += f"""**Press Release:** {pr_time.strftime('%Y-%m-%d %H:%M:%S')} UTC  
+        sections.append(f"""**Press Release:** {pr_time.strftime('%Y-%m-%d %H:%M:%S')} UTC  
 **Lookback Period:** {pre['lookback_days']} days  
 **Analysis Period:** {period_start.date()} → {period_end.date()}
 
@@ -346,79 +464,128 @@ def generate_report(state: AgentState) -> AgentState:
 **News Coverage:**
 - {pre['news']['count']} relevant articles analyzed
 
-"""
+""")
 
-    report += f"""## Data Collected
-- Prepared remarks: {len(state['prepared_remarks'])} interventions
-- Q&A section: {len(state['qa_section'])} interventions
-- Pre-call news: {len(state['news_pre_call'])} articles
-- Post-call news: {len(state['news_post_call'])} articles
-- Price bars (event): {len(state['stock_prices'])} bars
+    sections.append(f"""## Data Collected
+- Prepared remarks: {len(state.prepared_remarks)} interventions
+- Q&A section: {len(state.qa_section)} interventions
+- Pre-call news: {len(state.news_pre_call)} articles
+- Post-call news: {len(state.news_post_call)} articles
+- Price bars (event): {len(state.stock_prices)} bars
 
 ## Event Reaction
-"""
+""")
     
-    if state['stock_prices']:
-        first_price = state['stock_prices'][0]['close']
-        last_price = state['stock_prices'][-1]['close']
-        event_change = ((last_price - first_price) / first_price) * 100
-        
-        report += f"""- Price during call: ${first_price:.2f} → ${last_price:.2f}
-- Immediate reaction: {event_change:+.2f}%
+    reaction = state.event_reaction
+    if reaction:
+        sections.append(f"""- Price during call: ${reaction['first']:.2f} → ${reaction['last']:.2f}
+- Immediate reaction: {reaction['pct']:+.2f}%
 
-"""
+""")
 
-    report += f"""## Next Steps
-- LLM analysis to extract key metrics
-- Sentiment analysis of Q&A themes
-- Correlation of price movement with call content
-- Generate actionable investment insights
-"""
+    sections.append(NEXT_STEPS_SECTION)
 
-    state['report'] = report
-    state['current_step'] = "complete"
+    report = "".join(sections)
 
-    print(f"✅ Report generated")
+    state.report = report
+    state.current_step = "complete"
+
+    _say(state.verbose, f"✅ Report generated")
 
     return state
 
 
-# Simple linear execution for now
-def run_agent(call_id: str) -> AgentState:
+# Linear node order; independent I/O inside it runs concurrently
+def run_agent(call_id: str, verbose: bool = True) -> AgentState:
     """
     Run the earnings analyst agent.
+    
+    Args:
+        call_id: Unique identifier (e.g., 'earnings:nvda:q3-fy2026')
+        verbose: Print progress; pass False for batch runs (errors are
+            still collected in state.errors)
     """
-    print("=" * 70)
-    print("🤖 Starting Earnings Impact Analyst Agent")
-    print("=" * 70)
+    _say(verbose, "=" * 70)
+    _say(verbose, "🤖 Starting Earnings Impact Analyst Agent")
+    _say(verbose, "=" * 70)
 
     # Create initial state
-    state = create_initial_state(call_id)
+    state = create_initial_state(call_id, verbose=verbose)
+
+    state = _run_nodes(state)
+
+    _say(verbose, "\n" + "=" * 70)
+    if state.errors:
+        _say(verbose, "⚠️  Agent completed with errors:")
+        for error in state.errors:
+            _say(verbose, f"   - {error}")
+    else:
+        _say(verbose, "✅ Agent completed successfully!")
+    _say(verbose, "=" * 70)
+
+    return state
+
+
+def run_agent_batch(
+    call_ids: List[str],
+    max_workers: int = 4,
+    verbose: bool = False
+) -> Dict[str, AgentState]:
+    """
+    Run the agent over many earnings calls.
+    
+    Call metadata for all ids is loaded in one query up front, then the
+    calls run concurrently (each run is DB/HTTP bound).
+    
+    Args:
+        call_ids: Unique identifiers (duplicates are run once)
+        max_workers: Calls processed at the same time
+        verbose: Print per-node progress (interleaves across calls)
+    
+    Returns:
+        Dict mapping call_id -> final AgentState
+    """
+    ids = list(dict.fromkeys(call_ids))
+    print(f"🤖 Running Earnings Impact Analyst on {len(ids)} calls...")
+
+    # Call metadata for every id in 1 query instead of one per call.
+    # Unknown ids simply fall through to the per-call lookup (and error there).
+    calls = get_earnings_calls(ids)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ids) or 1))) as ex:
+        states = list(ex.map(
+            lambda call_id: _run_nodes(
+                create_initial_state(call_id, verbose=verbose, call=calls.get(call_id))
+            ),
+            ids
+        ))
 
-    # Execute nodes in sequence
+    failed = sum(1 for state in states if state.errors)
+    print(f"✅ {len(ids) - failed}/{len(ids)} calls completed without errors")
+
+    return dict(zip(ids, states))
+
+
+def _run_nodes(state: AgentState) -> AgentState:
+    """Execute the agent nodes on state (no banners)."""
     state = load_call_info(state)
 
-    if state['current_step'] != "error":
-        state = load_content(state)
+    if state.current_step != "error":
+        # Market data only needs the call metadata: start both OHLC requests
+        # now so they overlap with the DB round trips in load_content
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            prefetched = prefetch_prices(state, ex)
+            state = load_content(state)
 
-    if state['current_step'] != "error":
-        state = fetch_prices(state)
+            if state.current_step != "error":
+                state = fetch_prices(state, prefetched=prefetched)
 
-    if state['current_step'] != "error":
+    if state.current_step != "error":
         state = analyze(state)
 
-    if state['current_step'] != "error":
+    if state.current_step != "error":
         state = generate_report(state)
 
-    print("\n" + "=" * 70)
-    if state['errors']:
-        print("⚠️  Agent completed with errors:")
-        for error in state['errors']:
-            print(f"   - {error}")
-    else:
-        print("✅ Agent completed successfully!")
-    print("=" * 70)
-
     return state
 
 if __name__ == "__main__":
@@ -426,8 +593,8 @@ if __name__ == "__main__":
     state = run_agent("earnings:nvda:q3-fy2026")
 
     # Print report
-    if state['report']:
+    if state.report:
         print("\n" + "=" * 70)
         print("GENERATED REPORT:")
         print("=" * 70)
-        print(state['report'])
\ No newline at end of file
+        print(state.report)
\ No newline at end of file
@@ -3,35 +3,23 @@
 Gap Analyzer
 Compares market expectations vs actual results to identify surprises.
 """
-from typing import Dict
-import json
+from typing import Dict, List
 import os
+import time
+import orjson
 from mistralai import Mistral
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Gap analysis prompt
-GAP_ANALYSIS_PROMPT = """You are a financial analyst comparing market EXPECTATIONS vs ACTUAL RESULTS from an earnings announcement.
+# Gap analysis rubric: static, so it is sent byte-identical as the system
+# message on every call (provider-side prefix caching); keep per-call data out of it
+SYSTEM_RUBRIC = """You are a financial analyst comparing market EXPECTATIONS vs ACTUAL RESULTS from an earnings announcement.
 
 Your task: Identify surprises (beats and misses) and assess their market impact.
 
----
-
-CONTEXT:
-Company: {company_name}
-Quarter: {quarter}
-
----
-
-MARKET EXPECTATIONS (from analyst coverage before earnings):
-{expectations_json}
-
----
-
-ACTUAL RESULTS (from press release):
-{actuals_json}
+The user message gives the CONTEXT, the MARKET EXPECTATIONS (from analyst coverage before earnings) and the ACTUAL RESULTS (from press release).
 
 ---
 
@@ -87,9 +75,9 @@ OUTPUT FORMAT:
 
 Return valid JSON with this exact structure:
 
-{{
+{
   "positive_surprises": [
-    {{
+    {
       "metric": "name of metric (e.g., Revenue)",
       "expected": "what was expected with source confidence",
       "actual": "what was reported",
@@ -98,11 +86,11 @@ Return valid JSON with this exact structure:
       "significance": "HIGH|MEDIUM|LOW",
       "explanation": "why this matters",
       "expectation_confidence": "confidence level from expectations (HIGH|MEDIUM|LOW)"
-    }}
+    }
   ],
   
   "negative_surprises": [
-    {{
+    {
       "metric": "name of metric",
       "expected": "what was expected",
       "actual": "what was reported",
@@ -111,38 +99,38 @@ Return valid JSON with this exact structure:
       "significance": "HIGH|MEDIUM|LOW",
       "explanation": "why this is concerning",
       "expectation_confidence": "confidence level from expectations"
-    }}
+    }
   ],
   
   "in_line_results": [
-    {{
+    {
       "metric": "name of metric",
       "expected": "what was expected",
       "actual": "what was reported",
       "variance": "small difference if any"
-    }}
+    }
   ],
   
-  "guidance_analysis": {{
+  "guidance_analysis": {
     "q4_revenue_vs_expectations": "comparison if expectations mentioned Q4",
     "guidance_surprise": "beat|in-line|miss|not-discussed",
     "significance": "how important is this guidance"
-  }},
+  },
   
   "new_information_not_anticipated": [
-    {{
+    {
       "type": "product|partnership|commentary|strategic|other",
       "information": "what was announced",
       "significance": "HIGH|MEDIUM|LOW",
       "potential_impact": "how this might affect stock"
-    }}
+    }
   ],
   
   "narrative_changes": [
     "any shifts in management tone or themes vs pre-event coverage"
   ],
   
-  "market_impact_assessment": {{
+  "market_impact_assessment": {
     "overall_verdict": "strong beat|slight beat|in-line|slight miss|significant miss|mixed",
     "expected_stock_reaction": "direction and magnitude (e.g., +4-6%, -2-3%)",
     "confidence_in_prediction": "HIGH|MEDIUM|LOW",
@@ -154,8 +142,8 @@ Return valid JSON with this exact structure:
     "questions_for_qa": [
       "what analysts will likely ask about in earnings call"
     ]
-  }}
-}}
+  }
+}
 
 ---
 
@@ -167,6 +155,88 @@ IMPORTANT:
 - Be specific about market impact - use percentages for expected reactions
 """
 
+# Per-call data, appended after the rubric
+USER_TEMPLATE = """CONTEXT:
+Company: {company_name}
+Quarter: {quarter}
+
+---
+
+MARKET EXPECTATIONS (from analyst coverage before earnings):
+{expectations_json}
+
+---
+
+ACTUAL RESULTS (from press release):
+{actuals_json}
+"""
+
+
+def _error_result(message: str) -> Dict:
+    """Empty gap analysis carrying an error (same shape as a real result)."""
+    return {
+        'error': message,
+        'positive_surprises': [],
+        'negative_surprises': [],
+        'market_impact_assessment': {}
+    }
+
+
+def _resolve_labels(expectations: Dict, actuals: Dict, company_name: str, quarter: str):
+    """Fill in company/quarter from the inputs' metadata when not given."""
+    if not company_name:
+        company_name = (
+            expectations.get('_metadata', {}).get('company_name') or
+            actuals.get('_metadata', {}).get('company_name') or
+            "Company"
+        )
+    
+    if not quarter:
+        quarter = (
+            expectations.get('_metadata', {}).get('quarter') or
+            actuals.get('_metadata', {}).get('quarter') or
+            "Quarter"
+        )
+    
+    return company_name, quarter
+
+
+def _build_messages(expectations: Dict, actuals: Dict, company_name: str, quarter: str) -> List[Dict]:
+    """Chat messages for one comparison: static rubric first, per-call data last."""
+    # Convert to compact JSON strings for LLM (indentation only adds prompt tokens)
+    expectations_json = orjson.dumps(
+        expectations, default=str, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+    actuals_json = orjson.dumps(
+        actuals, default=str, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+    
+    # Create prompt (dynamic fields only; the rubric goes in the system message)
+    prompt = USER_TEMPLATE.format(
+        company_name=company_name,
+        quarter=quarter,
+        expectations_json=expectations_json,
+        actuals_json=actuals_json
+    )
+    
+    return [
+        {
+            "role": "system",
+            "content": SYSTEM_RUBRIC
+        },
+        {
+            "role": "user",
+            "content": prompt
+        }
+    ]
+
+
+def _get_client() -> Mistral:
+    api_key = os.getenv('MISTRAL_API_KEY')
+    if not api_key:
+        raise ValueError("MISTRAL_API_KEY not found in environment")
+    return Mistral(api_key=api_key)
+
 
 def compare_expectations_vs_actuals(
     expectations: Dict,
@@ -194,8 +264,8 @@ def compare_expectations_vs_actuals(
         >>> from aifinreport.agents.gap_analyzer import compare_expectations_vs_actuals
         >>> 
         >>> # Load expectations
-        >>> with open('data/expectations_nvda_q3_fy2026.json') as f:
-        ...     expectations = json.load(f)
+        >>> with open('data/expectations_nvda_q3_fy2026.json', 'rb') as f:
+        ...     expectations = orjson.loads(f.read())
         >>> 
         >>> # Extract actuals
         >>> actuals = extract_press_release_facts("earnings:nvda:q3-fy2026")
@@ -212,43 +282,16 @@ def compare_expectations_vs_actuals(
         >>> print(gap_analysis['market_impact_assessment'])
     """
     if expectations.get('error') or actuals.get('error'):
-        return {
-            'error': 'Cannot compare - missing expectations or actuals',
-            'positive_surprises': [],
-            'negative_surprises': [],
-            'market_impact_assessment': {}
-        }
+        return _error_result('Cannot compare - missing expectations or actuals')
     
     # Extract metadata
-    if not company_name:
-        company_name = (
-            expectations.get('_metadata', {}).get('company_name') or
-            actuals.get('_metadata', {}).get('company_name') or
-            "Company"
-        )
-    
-    if not quarter:
-        quarter = (
-            expectations.get('_metadata', {}).get('quarter') or
-            actuals.get('_metadata', {}).get('quarter') or
-            "Quarter"
-        )
+    company_name, quarter = _resolve_labels(expectations, actuals, company_name, quarter)
     
     print(f"\n🔍 Comparing expectations vs actuals...")
     print(f"   Company: {company_name}")
     print(f"   Quarter: {quarter}")
     
-    # Convert to JSON strings for LLM
-    expectations_json = json.dumps(expectations, indent=2, default=str)
-    actuals_json = json.dumps(actuals, indent=2, default=str)
-    
-    # Create prompt
-    prompt = GAP_ANALYSIS_PROMPT.format(
-        company_name=company_name,
-        quarter=quarter,
-        expectations_json=expectations_json,
-        actuals_json=actuals_json
-    )
+    messages = _build_messages(expectations, actuals, company_name, quarter)
     
     # Get LLM settings
     llm_provider = os.getenv('LLM_PROVIDER', 'mistral')
@@ -259,25 +302,28 @@ def compare_expectations_vs_actuals(
     # Call LLM
     if llm_provider == 'mistral':
         try:
-            api_key = os.getenv('MISTRAL_API_KEY')
-            if not api_key:
-                raise ValueError("MISTRAL_API_KEY not found in environment")
+            client = _get_client()
             
-            client = Mistral(api_key=api_key)
+            # Stream the response: tokens arrive as they are generated and
+            # are parsed once at the end
+            started = time.perf_counter()
+            chunks = []
             
-            response = client.chat.complete(
+            stream = client.chat.stream(
                 model=llm_model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                messages=messages,
                 response_format={"type": "json_object"}
             )
             
-            result_text = response.choices[0].message.content
-            gap_analysis = json.loads(result_text)
+            for event in stream:
+                delta = event.data.choices[0].delta.content
+                if isinstance(delta, str) and delta:
+                    if not chunks:
+                        print(f"   ⏱️  First token after {time.perf_counter() - started:.1f}s")
+                    chunks.append(delta)
+            
+            result_text = "".join(chunks)
+            gap_analysis = orjson.loads(result_text)
             
             print(f"   ✅ Gap analysis completed")
             
@@ -293,20 +339,158 @@ def compare_expectations_vs_actuals(
             
         except Exception as e:
             print(f"   ❌ Error calling LLM: {e}")
-            return {
-                'error': str(e),
-                'positive_surprises': [],
-                'negative_surprises': [],
-                'market_impact_assessment': {}
-            }
+            return _error_result(str(e))
     else:
         print(f"   ⚠️  LLM provider '{llm_provider}' not yet supported")
-        return {
-            'error': f'LLM provider {llm_provider} not implemented',
-            'positive_surprises': [],
-            'negative_surprises': [],
-            'market_impact_assessment': {}
+        return _error_result(f'LLM provider {llm_provider} not implemented')
+
+
+def submit_gap_analyses_batch(rows: List[Dict], model: str = None) -> str:
+    """
+    Submit many comparisons as one Mistral batch job (offline backfills).
+    
+    Batch inference is billed at a discount and isn't rate-limited like
+    real-time calls; results arrive asynchronously via
+    fetch_gap_analyses_batch().
+    
+    Args:
+        rows: One dict per comparison with keys 'expectations', 'actuals',
+              and optionally 'company_name', 'quarter' and 'custom_id'
+              (defaults to the row's index)
+        model: Optional model override (defaults to env LLM_MODEL)
+    
+    Returns:
+        Batch job id
+    
+    Example:
+        >>> batch_id = submit_gap_analyses_batch([
+        ...     {'custom_id': 'nvda-q3', 'expectations': exp_q3, 'actuals': act_q3},
+        ...     {'custom_id': 'nvda-q2', 'expectations': exp_q2, 'actuals': act_q2},
+        ... ])
+        >>> results = fetch_gap_analyses_batch(batch_id)
+        >>> print_gap_analysis_summary(results['nvda-q3'])
+    """
+    llm_model = model or os.getenv('LLM_MODEL', 'mistral-large-latest')
+    
+    lines = []
+    labels = {}
+    for i, row in enumerate(rows):
+        custom_id = str(row.get('custom_id', i))
+        expectations = row['expectations']
+        actuals = row['actuals']
+        
+        if expectations.get('error') or actuals.get('error'):
+            print(f"   ⚠️  Skipping {custom_id}: missing expectations or actuals")
+            continue
+        
+        company_name, quarter = _resolve_labels(
+            expectations, actuals, row.get('company_name'), row.get('quarter')
+        )
+        labels[custom_id] = [
+            company_name,
+            quarter,
+            expectations.get('_metadata', {}).get('article_count')
+        ]
+        lines.append(orjson.dumps({
+            "custom_id": custom_id,
+            "body": {
+                "messages": _build_messages(expectations, actuals, company_name, quarter),
+                "response_format": {"type": "json_object"}
+            }
+        }))
+    
+    if not lines:
+        raise ValueError("No valid rows to submit")
+    
+    client = _get_client()
+    
+    print(f"\n📦 Submitting {len(lines)} gap analyses as a batch job ({llm_model})...")
+    input_file = client.files.upload(
+        file={
+            "file_name": "gap_analyses.jsonl",
+            "content": b"\n".join(lines)
+        },
+        purpose="batch"
+    )
+    
+    job = client.batch.jobs.create(
+        input_files=[input_file.id],
+        model=llm_model,
+        endpoint="/v1/chat/completions",
+        # Labels for the results' _metadata (the output only echoes custom_id)
+        metadata={"labels": orjson.dumps(labels).decode()}
+    )
+    
+    print(f"   ✅ Batch job submitted: {job.id}")
+    
+    return job.id
+
+
+def fetch_gap_analyses_batch(batch_id: str, poll_interval: float = 30.0) -> Dict[str, Dict]:
+    """
+    Wait for a batch job from submit_gap_analyses_batch() and parse its results.
+    
+    Args:
+        batch_id: Id returned by submit_gap_analyses_batch()
+        poll_interval: Seconds between status checks
+    
+    Returns:
+        Dict mapping custom_id -> gap analysis, each in the same shape as
+        compare_expectations_vs_actuals() returns (failed rows carry 'error')
+    """
+    client = _get_client()
+    
+    print(f"\n📦 Waiting for batch job {batch_id}...")
+    job = client.batch.jobs.get(job_id=batch_id)
+    while job.status in ("QUEUED", "RUNNING"):
+        time.sleep(poll_interval)
+        job = client.batch.jobs.get(job_id=batch_id)
+    
+    print(f"   Status: {job.status}")
+    
+    labels = orjson.loads((job.metadata or {}).get("labels") or "{}")
+    results = {
+        custom_id: _error_result(f"Batch job ended with status {job.status}")
+        for custom_id in labels
+    }
+    
+    if not job.output_file:
+        print(f"   ❌ No output file for batch job {batch_id}")
+        return results
+    
+    output = client.files.download(file_id=job.output_file).read()
+    
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        
+        record = orjson.loads(line)
+        custom_id = record.get("custom_id")
+        response = record.get("response") or {}
+        
+        try:
+            if record.get("error") or response.get("status_code") != 200:
+                raise ValueError(record.get("error") or response.get("body"))
+            
+            result_text = response["body"]["choices"][0]["message"]["content"]
+            gap_analysis = orjson.loads(result_text)
+        except Exception as e:
+            results[custom_id] = _error_result(str(e))
+            continue
+        
+        company_name, quarter, article_count = labels.get(custom_id, [None, None, None])
+        gap_analysis['_metadata'] = {
+            'company_name': company_name,
+            'quarter': quarter,
+            'expectations_article_count': article_count,
+            'model': job.model
         }
+        results[custom_id] = gap_analysis
+    
+    succeeded = sum(1 for r in results.values() if not r.get('error'))
+    print(f"   ✅ {succeeded}/{len(results)} gap analyses completed")
+    
+    return results
 
 
 def print_gap_analysis_summary(gap_analysis: Dict):
@@ -495,8 +679,8 @@ if __name__ == "__main__":
     # Load expectations
     expectations_file = f"data/expectations_{call_id.replace('earnings:', '').replace(':', '_')}.json"
     try:
-        with open(expectations_file, 'r') as f:
-            expectations = json.load(f)
+        with open(expectations_file, 'rb') as f:
+            expectations = orjson.loads(f.read())
         print(f"✅ Loaded expectations from: {expectations_file}")
     except FileNotFoundError:
         print(f"❌ Expectations file not found: {expectations_file}")
@@ -506,8 +690,8 @@ if __name__ == "__main__":
     # Load actuals
     actuals_file = f"data/actuals_{call_id.replace('earnings:', '').replace(':', '_')}.json"
     try:
-        with open(actuals_file, 'r') as f:
-            actuals = json.load(f)
+        with open(actuals_file, 'rb') as f:
+            actuals = orjson.loads(f.read())
         print(f"✅ Loaded actuals from: {actuals_file}")
     except FileNotFoundError:
         print(f"❌ Actuals file not found: {actuals_file}")
@@ -528,6 +712,10 @@ if __name__ == "__main__":
     # Save to file
     output_file = f"data/gap_analysis_{call_id.replace('earnings:', '').replace(':', '_')}.json"
     os.makedirs("data", exist_ok=True)
-    with open(output_file, 'w') as f:
-        json.dump(gap_analysis, f, indent=2, default=str)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(
+            gap_analysis,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        ))
     print(f"\n💾 Full gap analysis saved to: {output_file}")
\ No newline at end of file
@@ -2,11 +2,13 @@
 """
 News Period Analyst - Analyze news and stock performance for any time period
 """
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone as tz
 from typing import Dict, List
 from aifinreport.tools.database_tools import search_news
 from aifinreport.tools.market_data_tools import fetch_ohlc_bars
 from aifinreport.agents.news_ranker import (
+    load_model,
     rank_articles_by_relevance,
     print_ranked_articles
 )
@@ -84,17 +86,28 @@ def analyze_news_period(
     period_days = (end_date - start_date).days
     print(f"Duration: {period_days} days")
     
+    # News, prices and the embedding model load are independent: start all
+    # three at once so the network waits overlap the model load
+    pool = ThreadPoolExecutor(max_workers=3)
+    news_fut = pool.submit(
+        search_news, ticker=ticker, start_time=start_date, end_time=end_date
+    )
+    bars_fut = pool.submit(fetch_ohlc_bars, ticker, start_date, end_date, "1day")
+    model_fut = pool.submit(load_model)
+    pool.shutdown(wait=False)
+    
     # Get news
     print(f"\n📰 Fetching news articles...")
-    all_news = search_news(
-        ticker=ticker,
-        start_time=start_date,
-        end_time=end_date
-    )
+    all_news = news_fut.result()
     print(f"   Found {len(all_news)} total articles")
     
     if len(all_news) == 0:
         print("\n⚠️  No articles found for this period")
+        # Nothing to rank or price: drop the background work (a task that
+        # already started is waited for, so no thread outlives the call)
+        for fut in (bars_fut, model_fut):
+            fut.cancel()
+        wait([bars_fut, model_fut])
         return {
             'ticker': ticker,
             'quarter': quarter,
@@ -111,8 +124,10 @@ def analyze_news_period(
             'bars': []
         }
     
-    # Rank by semantic relevance
+    # Rank by semantic relevance. A failed background load is not raised
+    # here: ranking loads the model itself if it still needs it.
     print(f"\n🔍 Ranking articles by relevance using local embeddings...")
+    wait([model_fut])
     ranked_news = rank_articles_by_relevance(
         all_news,
         ticker=ticker,
@@ -126,12 +141,7 @@ def analyze_news_period(
     
     # Get stock prices
     print(f"\n📈 Fetching stock prices...")
-    bars = fetch_ohlc_bars(
-        ticker,
-        start_date,
-        end_date,
-        "1day"
-    )
+    bars = bars_fut.result()
     print(f"   Fetched {len(bars)} daily bars")
     
     # Calculate return
@@ -2,12 +2,134 @@
 """
 Semantic ranking of news articles using local embeddings
 """
-from typing import List, Dict
+from typing import List, Dict, Optional, TYPE_CHECKING
+import functools
+import hashlib
+import html
+import re
+import threading
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+from aifinreport.cache import get_bytes, put_bytes
+from aifinreport.config import CACHE_DIR, EMBEDDING_BACKEND, EMBEDDING_ONNX_FILE
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 # Global model instance (loaded once)
 _model = None
+_model_lock = threading.Lock()
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+
+# On-disk embedding cache: article text doesn't change once published, so
+# re-ranking the same articles skips the encoder (and, on a full hit, the
+# model load). Bump EMBEDDING_CACHE_VERSION if the model or truncation change.
+EMBEDDING_CACHE_VERSION = 1
+EMBEDDING_CACHE_DIR = CACHE_DIR / "embeddings"
+
+# Earnings-focused ranking query; only ticker and quarter vary
+QUERY_TEMPLATE = """Insights about {ticker}'s upcoming {quarter} quarterly earnings results, including:
+- Analyst forecasts and consensus estimates
+- Revenue and EPS expectations
+- Margin outlook and profitability trends
+- Guidance changes or updates
+- Demand trends and order patterns
+- Key risks and headwinds
+- Competitive pressures
+- Investor sentiment and price targets"""
+
+
+def _embedding_cache_key(text: str, normalize: bool) -> str:
+    ident = (
+        f"v{EMBEDDING_CACHE_VERSION}|{MODEL_NAME}|{EMBEDDING_BACKEND}|{EMBEDDING_ONNX_FILE}"
+        f"|{int(normalize)}|{text}"
+    )
+    return hashlib.sha256(ident.encode("utf-8")).hexdigest()
+
+
+def _embedding_cache_get(key: str) -> Optional[np.ndarray]:
+    data = get_bytes(EMBEDDING_CACHE_DIR / f"{key}.f32")
+    if data is None or len(data) != EMBEDDING_DIM * 4:
+        return None
+    return np.frombuffer(data, dtype=np.float32)
+
+
+def _embedding_cache_put(key: str, embedding: np.ndarray) -> None:
+    put_bytes(EMBEDDING_CACHE_DIR / f"{key}.f32", embedding.astype(np.float32).tobytes())
+
+
+def _get_model(verbose: bool = True) -> "SentenceTransformer":
+    """Load the embedding model on first use (takes ~2 seconds, only once)."""
+    global _model
+    
+    if _model is not None:
+        return _model
+    
+    with _model_lock:
+        if _model is not None:
+            return _model
+        
+        # torch + sentence_transformers take seconds to import; only pay that here
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        # Prefer an accelerator when one is available
+        if torch.cuda.is_available():
+            device = "cuda"
+        elif torch.backends.mps.is_available():
+            device = "mps"
+        else:
+            device = "cpu"
+
+        if EMBEDDING_BACKEND == "onnx" and device == "cpu":
+            # ONNX Runtime: fused attention kernels (and int8 GEMM with a
+            # quantized EMBEDDING_ONNX_FILE); same encode() interface
+            if verbose:
+                print(f"   Loading embedding model on cpu/onnx (one-time, ~2 seconds)...")
+            model_kwargs = {"file_name": EMBEDDING_ONNX_FILE} if EMBEDDING_ONNX_FILE else None
+            model = SentenceTransformer(
+                MODEL_NAME, device=device, backend="onnx", model_kwargs=model_kwargs
+            )
+        else:
+            if verbose:
+                print(f"   Loading embedding model on {device} (one-time, ~2 seconds)...")
+            model = SentenceTransformer(MODEL_NAME, device=device)
+
+        # Half precision on CUDA: half the memory traffic, tensor-core matmuls
+        if device == "cuda":
+            model.half()
+
+        # Make sure tokenization runs on the Rust (fast) tokenizer
+        if not getattr(model.tokenizer, "is_fast", False):
+            from transformers import AutoTokenizer
+            model.tokenizer = AutoTokenizer.from_pretrained(
+                "sentence-transformers/all-MiniLM-L6-v2", use_fast=True
+            )
+
+        # Publish only once fully configured (readers skip the lock)
+        _model = model
+        if verbose:
+            print("   ✅ Model loaded")
+        
+        return _model
+
+
+def load_model(verbose: bool = True) -> None:
+    """
+    Load the embedding model ahead of time.
+    
+    Lets callers overlap the one-time load with I/O (e.g. run it on a
+    thread while news and prices are fetched). No-op once loaded.
+    """
+    _get_model(verbose)
 
 
 def get_embedding(text: str) -> List[float]:
@@ -20,38 +142,123 @@ def get_embedding(text: str) -> List[float]:
     Returns:
         Embedding vector (384 dimensions for all-MiniLM-L6-v2)
     """
-    global _model
-    
-    # Load model on first use (takes ~2 seconds, only once)
-    if _model is None:
-        print("   Loading embedding model (one-time, ~2 seconds)...")
-        _model = SentenceTransformer('all-MiniLM-L6-v2')
-        print("   ✅ Model loaded")
+    model = _get_model()
     
     # Truncate to model's max length
     text = text[:8000]
     
     # Encode (no API call, runs locally)
-    embedding = _model.encode(text, show_progress_bar=False, convert_to_numpy=True)
+    embedding = model.encode(text, show_progress_bar=False, convert_to_numpy=True)
     
     return embedding.tolist()
 
 
-def cosine_similarity(a: List[float], b: List[float]) -> float:
-    """Calculate cosine similarity between two vectors."""
-    a = np.array(a)
-    b = np.array(b)
+def get_embeddings(
+    texts: List[str],
+    batch_size: int = 32,
+    normalize: bool = False,
+    use_cache: bool = True,
+    verbose: bool = True
+) -> np.ndarray:
+    """
+    Embed many texts in a single batched forward pass.
+    
+    SentenceTransformer sorts the inputs by length internally, so each
+    batch is padded only to its longest member. Embeddings are cached on
+    disk by text hash; only cache misses are sent to the model.
+    
+    Args:
+        texts: Texts to embed
+        batch_size: Number of texts per forward pass
+        normalize: L2-normalize rows, so a dot product is the cosine similarity
+        use_cache: Read/write the on-disk embedding cache
+        verbose: Print model-loading progress
+    
+    Returns:
+        Contiguous float32 array of shape (len(texts), 384)
+    """
+    texts = [t[:8000] for t in texts]
+    embeddings = np.empty((len(texts), EMBEDDING_DIM), dtype=np.float32)
     
-    return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+    keys = [_embedding_cache_key(t, normalize) for t in texts] if use_cache else []
+    missing = []
+    for i in range(len(texts)):
+        cached = _embedding_cache_get(keys[i]) if use_cache else None
+        if cached is None:
+            missing.append(i)
+        else:
+            embeddings[i] = cached
+    
+    if missing:
+        model = _get_model(verbose)
+        
+        encoded = model.encode(
+            [texts[i] for i in missing],
+            batch_size=batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=normalize
+        )
+        
+        # fp16 on CUDA returns float16; keep a single BLAS-friendly dtype
+        embeddings[missing] = encoded
+        
+        if use_cache:
+            for i in missing:
+                _embedding_cache_put(keys[i], embeddings[i])
+    
+    return embeddings
+
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_TAG_RE = re.compile(r"<[^>]+>")
+# A real tag: closing, or a name with only name=value attributes, so plain
+# text like "a<b and c>d" is left alone
+_MARKUP_RE = re.compile(
+    r"</[a-zA-Z][\w-]*\s*>"
+    r"|<[a-zA-Z][\w-]*(?:\s+[\w:-]+\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s>]+))*\s*/?>"
+)
+# Separators left at the start of a body once a repeated headline is cut
+_LEADING_PUNCT = " \t\n.,:;|-\u2013\u2014"
 
-def extract_article_text(article: Dict, max_chars: int = 1500) -> str:
+
+def _clean_text(text: str) -> str:
+    """Strip HTML markup/entities and collapse whitespace to single spaces."""
+    if _MARKUP_RE.search(text):
+        if LXML_AVAILABLE:
+            try:
+                doc = lxml.html.fromstring(text)
+                for el in list(doc.iter("script", "style")):
+                    el.drop_tree()
+                # Join text nodes with spaces so adjacent blocks don't fuse
+                text = " ".join(doc.itertext())
+            except Exception:
+                text = _TAG_RE.sub(" ", text)
+        else:
+            text = _TAG_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", html.unescape(text)).strip()
+
+
+@functools.lru_cache(maxsize=256)
+def _query_embedding(ticker: str, quarter: str, verbose: bool = True) -> np.ndarray:
+    """Unit-length float32 embedding of the ranking query (memoized, read-only)."""
+    query = QUERY_TEMPLATE.format(ticker=ticker, quarter=quarter)
+    embedding = get_embeddings([query], normalize=True, verbose=verbose)[0]
+    embedding.flags.writeable = False
+    return embedding
+
+
+def extract_article_text(article: Dict, max_chars: int = 1800) -> str:
     """
     Extract relevant text from article for embedding.
     
+    HTML and repeated whitespace are stripped, and a body that starts with
+    the title/description doesn't repeat them, so more of the model's
+    512-token window carries article content.
+    
     Args:
         article: Article dict with title, description, full_body
-        max_chars: Maximum characters to extract
+        max_chars: Maximum characters to extract (~450 tokens)
     
     Returns:
         Combined text for embedding
@@ -59,20 +266,29 @@ def extract_article_text(article: Dict, max_chars: int = 1500) -> str:
     parts = []
     
     # Title (most important)
-    if article.get('title'):
-        parts.append(article['title'])
+    title = _clean_text(article.get('title') or '')
+    if title:
+        parts.append(title)
     
     # Description/summary
-    if article.get('description'):
-        parts.append(article['description'])
+    description = _clean_text(article.get('description') or '')
+    if description:
+        parts.append(description)
     
     # First part of body
     if article.get('full_body'):
-        body = article['full_body']
-        # Take first few paragraphs (up to max_chars)
         remaining = max_chars - sum(len(p) for p in parts)
         if remaining > 0:
-            parts.append(body[:remaining])
+            # Clean a bounded slice: markup only shrinks the text
+            body = _clean_text(article['full_body'][:remaining * 4])
+            
+            # Many feeds repeat the headline/summary at the top of the body
+            for prefix in (title, description):
+                if prefix and body.startswith(prefix):
+                    body = body[len(prefix):].lstrip(_LEADING_PUNCT)
+            
+            if body:
+                parts.append(body[:remaining])
     
     return "\n\n".join(parts)
 
@@ -81,7 +297,8 @@ def rank_articles_by_relevance(
     articles: List[Dict],
     ticker: str,
     quarter: str,
-    top_n: int = 10
+    top_n: int = 10,
+    verbose: bool = True
 ) -> List[Dict]:
     """
     Rank articles by semantic similarity to earnings expectations query.
@@ -91,57 +308,42 @@ def rank_articles_by_relevance(
         ticker: Company ticker (e.g., "NVDA")
         quarter: Quarter (e.g., "Q3")
         top_n: Number of top articles to return
+        verbose: Print progress
     
     Returns:
-        Top N articles with relevance scores
+        Top N articles with relevance scores (copies; the input dicts are
+        left untouched)
     """
     if not articles:
         return []
     
-    print(f"   Ranking {len(articles)} articles using local embeddings...")
-    
-    # Create earnings-focused query
-    query = f"""Insights about {ticker}'s upcoming {quarter} quarterly earnings results, including:
-- Analyst forecasts and consensus estimates
-- Revenue and EPS expectations
-- Margin outlook and profitability trends
-- Guidance changes or updates
-- Demand trends and order patterns
-- Key risks and headwinds
-- Competitive pressures
-- Investor sentiment and price targets"""
+    if verbose:
+        print(f"   Ranking {len(articles)} articles using local embeddings...")
     
-    # Get query embedding (loads model on first call)
-    query_embedding = get_embedding(query)
+    # Earnings-focused query embedding (encoded once per ticker/quarter)
+    query_embedding = _query_embedding(ticker, quarter, verbose)
     
-    # Embed each article and calculate similarity
-    scored_articles = []
+    # Embed all articles in one batched call
+    article_texts = [extract_article_text(article) for article in articles]
+    article_embeddings = get_embeddings(article_texts, normalize=True, verbose=verbose)
     
-    for i, article in enumerate(articles):
-        # Extract text
-        article_text = extract_article_text(article)
-        
-        # Get embedding
-        article_embedding = get_embedding(article_text)
-        
-        # Calculate similarity
-        similarity = cosine_similarity(query_embedding, article_embedding)
-        
-        # Add to article
-        article['relevance_score'] = similarity
-        article['_extracted_text'] = article_text  # For debugging
-        scored_articles.append(article)
-        
-        # Progress indicator (every 10 articles)
-        if (i + 1) % 10 == 0:
-            print(f"   Processed {i + 1}/{len(articles)} articles...")
+    # Rows are unit-length: one matrix-vector product gives every cosine similarity
+    similarities = article_embeddings @ query_embedding
     
-    # Sort by relevance
-    ranked = sorted(scored_articles, key=lambda x: x['relevance_score'], reverse=True)
+    # Sort by relevance (stable, so ties keep their input order)
+    order = np.argsort(-similarities, kind="stable")[:top_n].tolist()
     
-    print(f"   ✅ Ranked by semantic relevance")
+    if verbose:
+        print(f"   ✅ Ranked by semantic relevance")
     
-    return ranked[:top_n]
+    return [
+        {
+            **articles[i],
+            'relevance_score': float(similarities[i]),
+            '_extracted_text': article_texts[i],  # For debugging
+        }
+        for i in order
+    ]
 
 
 def print_ranked_articles(articles: List[Dict]):
@@ -4,8 +4,8 @@ Pre-Event Expectations Summarizer
 Analyzes news articles to extract market expectations before earnings press release.
 """
 from typing import Dict, List
-import json
 import os
+import orjson
 from mistralai import Mistral
 
 
@@ -293,7 +293,7 @@ def summarize_pre_event_expectations(
             )
             
             result_text = response.choices[0].message.content
-            expectations = json.loads(result_text)
+            expectations = orjson.loads(result_text)
             
             print(f"   ✅ Expectations summary generated")
             
@@ -493,6 +493,10 @@ if __name__ == "__main__":
     # Optionally save to file
     output_file = "data/expectations_nvda_q3_fy2026.json"
     os.makedirs("data", exist_ok=True)
-    with open(output_file, 'w') as f:
-        json.dump(expectations, f, indent=2, default=str)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(
+            expectations,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        ))
     print(f"\n💾 Full expectations saved to: {output_file}")
\ No newline at end of file
@@ -4,8 +4,8 @@ Press Release Facts Extractor
 Extracts actual financial results from earnings press releases.
 """
 from typing import Dict
-import json
 import os
+import orjson
 from mistralai import Mistral
 
 
@@ -280,7 +280,7 @@ def extract_press_release_facts(
             )
             
             result_text = response.choices[0].message.content
-            actuals = json.loads(result_text)
+            actuals = orjson.loads(result_text)
             
             print(f"   ✅ Facts extracted successfully")
             
@@ -463,6 +463,10 @@ if __name__ == "__main__":
     # Save to file
     output_file = f"data/actuals_{call_id.replace('earnings:', '').replace(':', '_')}.json"
     os.makedirs("data", exist_ok=True)
-    with open(output_file, 'w') as f:
-        json.dump(actuals, f, indent=2, default=str)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(
+            actuals,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        ))
     print(f"\n💾 Full actuals saved to: {output_file}")
\ No newline at end of file
@@ -4,11 +4,11 @@ Select relevant and diverse Yahoo Finance articles for a ticker.
 Uses API-aligned field names (url, source, tags).
 Scoring prioritizes content relevance (70%) over length (30%).
 """
+import re                                                          # Import re for the precompiled keyword-matching pattern
 from typing import List, Dict                                      # Import List and Dict type hints for function annotations (improves code readability and IDE support)
-import pandas as pd                                                # Import pandas for DataFrame operations (SQL query results, data manipulation)
+import numpy as np                                                 # Import NumPy for column-wise (vectorized) article scoring
 from sqlalchemy import text                                        # Import text function for creating parameterized SQL queries (prevents SQL injection)
-from sklearn.feature_extraction.text import TfidfVectorizer        # Import TF-IDF vectorizer to convert text into numerical vectors for similarity comparison
-from sklearn.metrics.pairwise import cosine_similarity             # Import cosine similarity function to measure how similar two articles are (for MMR diversity)
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer  # Import hashed term counter + TF-IDF weighting to turn text into vectors for similarity comparison
 from aifinreport.database.connection import engine                                    # Import the database engine (SQLAlchemy connection) to execute queries against PostgreSQL
 
 # ==============================================================================
@@ -50,6 +50,27 @@ FINANCIAL_KEYWORDS = [
     "%", "billion", "million", "$", "bps",
 ]
 
+# One pass over the text: a lookahead alternation (longest keyword first)
+# reports the longest keyword starting at every position
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(FINANCIAL_KEYWORDS, key=len, reverse=True)) + "))"
+)
+
+# Keywords implied by a match: itself plus any keyword it contains
+# (e.g. "quarterly" also contains "quarter"), so distinct counts stay exact
+_KEYWORD_CLOSURE = {
+    kw: frozenset(k for k in FINANCIAL_KEYWORDS if k in kw)
+    for kw in FINANCIAL_KEYWORDS
+}
+
+
+def _distinct_keywords(text_lower: str) -> set:
+    """Return the set of FINANCIAL_KEYWORDS contained in a lowercased text."""
+    found = set()
+    for kw in set(_KEYWORD_RE.findall(text_lower)):
+        found |= _KEYWORD_CLOSURE[kw]
+    return found
+
 # ==============================================================================
 # SCORING FUNCTIONS
 # ==============================================================================
@@ -118,8 +139,8 @@ def _score_content_relevance(title: str, description: str, summary: str) -> floa
     if title:
         # Convert to lowercase for case-insensitive matching
         title_lower = title.lower()
-        # Count keyword matches in title
-        title_matches = sum(1 for kw in FINANCIAL_KEYWORDS if kw in title_lower)
+        # Count keyword matches in title (single regex pass)
+        title_matches = len(_distinct_keywords(title_lower))
         # Normalize: 6 keywords = max score of 0.4
         # Each keyword contributes 0.4/6 = ~0.067
         title_score = min(title_matches / 6.0, 1.0) * 0.4
@@ -131,7 +152,7 @@ def _score_content_relevance(title: str, description: str, summary: str) -> floa
         # Convert to lowercase for case-insensitive matching
         desc_lower = description.lower()
         # Count unique keyword matches (using set to avoid double-counting)
-        desc_matches = len({kw for kw in FINANCIAL_KEYWORDS if kw in desc_lower})
+        desc_matches = len(_distinct_keywords(desc_lower))
         # Normalize: 10 unique keywords = max score of 0.3
         # Each keyword contributes 0.3/10 = 0.03
         desc_score = min(desc_matches / 10.0, 1.0) * 0.3
@@ -143,7 +164,7 @@ def _score_content_relevance(title: str, description: str, summary: str) -> floa
         # Convert to lowercase for case-insensitive matching
         summ_lower = summary.lower()
         # Count unique keyword matches (using set to avoid double-counting)
-        summ_matches = len({kw for kw in FINANCIAL_KEYWORDS if kw in summ_lower})
+        summ_matches = len(_distinct_keywords(summ_lower))
         # Normalize: 10 unique keywords = max score of 0.3
         # Each keyword contributes 0.3/10 = 0.03
         summ_score = min(summ_matches / 10.0, 1.0) * 0.3
@@ -200,10 +221,60 @@ def calculate_article_score(article: Dict) -> float:
     return round(total, 6)
 
 
+def _keyword_counts(texts: List[str]) -> np.ndarray:
+    """Count distinct FINANCIAL_KEYWORDS contained in each text."""
+    return np.fromiter(
+        (len(_distinct_keywords(t.lower())) for t in texts),
+        dtype=np.int64,
+        count=len(texts),
+    )
+
+
+def score_articles(articles: List[Dict]) -> np.ndarray:
+    """
+    Vectorized calculate_article_score over a list of articles.
+    
+    Same weights and curves as calculate_article_score, computed column-wise.
+    
+    Args:
+        articles: Article dicts (title, description, summary, full_body_chars)
+    
+    Returns:
+        Array of scores between 0.0 and 1.0, aligned with articles
+    """
+    if not articles:
+        return np.zeros(0)
+    
+    # Body length plateau curve (see _score_body_length)
+    n = np.array([a.get("full_body_chars") or 0 for a in articles], dtype=float)
+    body_score = np.select(
+        [n <= 500, n >= 6000, n <= 2500],
+        [0.0, 0.8, (n - 500) / 2000.0],
+        default=0.8 + (6000 - n) / 3500.0 * 0.2,
+    )
+    
+    # Content relevance (see _score_content_relevance)
+    title_score = np.minimum(_keyword_counts([a.get("title") or "" for a in articles]) / 6.0, 1.0) * 0.4
+    desc_score = np.minimum(_keyword_counts([a.get("description") or "" for a in articles]) / 10.0, 1.0) * 0.3
+    summ_score = np.minimum(_keyword_counts([a.get("summary") or "" for a in articles]) / 10.0, 1.0) * 0.3
+    content_score = np.minimum(title_score + desc_score + summ_score, 1.0)
+    
+    # Weighted combination: 30% length, 70% content
+    return np.round(0.30 * body_score + 0.70 * content_score, 6)
+
+
 # ==============================================================================
 # DIVERSITY FUNCTIONS (MMR)
 # ==============================================================================
 
+# Stateless term counter for MMR texts (hashes tokens, no per-call vocabulary)
+_mmr_hasher = HashingVectorizer(
+    n_features=1024,
+    alternate_sign=False,
+    norm=None,
+    stop_words='english',
+)
+
 def apply_mmr_diversity(articles: List[Dict], max_articles: int, lambda_param: float = 0.5) -> List[Dict]:
     """
     Apply Maximum Marginal Relevance to select diverse articles.
@@ -213,8 +284,8 @@ def apply_mmr_diversity(articles: List[Dict], max_articles: int, lambda_param: f
     2. Select articles different from already-selected ones (diversity)
     
     Process:
-    1. Convert articles to TF-IDF vectors (title + summary)
-    2. Calculate cosine similarity matrix (how similar articles are)
+    1. Convert articles to hashed TF-IDF vectors (title + summary)
+    2. Compute cosine similarities to each selected article as it is picked
     3. Start with highest-scored article
     4. Iteratively select articles that maximize: λ×relevance - (1-λ)×similarity
     
@@ -241,54 +312,42 @@ def apply_mmr_diversity(articles: List[Dict], max_articles: int, lambda_param: f
         for a in articles
     ]
     
-    # Calculate TF-IDF similarity matrix
-    # TF-IDF converts text to vectors, weighing rare words higher
-    vectorizer = TfidfVectorizer(max_features=100, stop_words='english')
-    tfidf_matrix = vectorizer.fit_transform(texts)
+    # Hashed TF-IDF vectors (no vocabulary pass); rows are L2-normalized,
+    # so a sparse dot product between two rows is their cosine similarity
+    tfidf_matrix = TfidfTransformer().fit_transform(_mmr_hasher.transform(texts))
     
-    # Cosine similarity: measures how similar two articles are (0=different, 1=identical)
-    similarities = cosine_similarity(tfidf_matrix)
+    # Similarity rows are computed lazily, only for articles that get selected,
+    # instead of materializing the full dense N×N matrix
+    def similarity_row(i: int) -> np.ndarray:
+        return (tfidf_matrix @ tfidf_matrix[i].T).toarray().ravel()
     
     # MMR selection algorithm
-    selected_idx = []           # Indices of selected articles
-    remaining_idx = set(range(len(articles)))  # Indices still available
+    relevance = np.array([a['__score'] for a in articles], dtype=float)
+    selected_mask = np.zeros(len(articles), dtype=bool)  # Articles already picked
+    selected_idx = []                                     # Indices in pick order
     
     # Step 1: Pick highest-scored article (best relevance)
-    best_idx = max(remaining_idx, key=lambda i: articles[i]['__score'])
+    best_idx = int(relevance.argmax())
     selected_idx.append(best_idx)
-    remaining_idx.remove(best_idx)
+    selected_mask[best_idx] = True
+    
+    # Running MAX similarity of every article to the selected set (worst case),
+    # updated only against the newly selected row
+    max_similarity = similarity_row(best_idx)
     
     # Step 2: Iteratively pick articles balancing score and diversity
-    while len(selected_idx) < max_articles and remaining_idx:
-        best_mmr = -float('inf')  # Track best MMR score
-        best_candidate = None      # Track best candidate
-        
-        # Evaluate each remaining article
-        for candidate in remaining_idx:
-            # Relevance component: how good is this article?
-            relevance = articles[candidate]['__score']
-            
-            # Diversity component: how similar is this to already-selected articles?
-            # We take the MAX similarity (worst case) to avoid redundancy
-            max_similarity = max(
-                similarities[candidate][selected]
-                for selected in selected_idx
-            )
-            
-            # MMR score: balance relevance and diversity
-            # λ * relevance - (1-λ) * similarity
-            # High relevance and low similarity = high MMR score
-            mmr_score = lambda_param * relevance - (1 - lambda_param) * max_similarity
-            
-            # Track the best candidate
-            if mmr_score > best_mmr:
-                best_mmr = mmr_score
-                best_candidate = candidate
+    while len(selected_idx) < max_articles and not selected_mask.all():
+        # MMR score: balance relevance and diversity
+        # λ * relevance - (1-λ) * similarity
+        # High relevance and low similarity = high MMR score
+        mmr_scores = lambda_param * relevance - (1 - lambda_param) * max_similarity
+        mmr_scores[selected_mask] = -np.inf
         
         # Add best candidate to selected set
-        if best_candidate is not None:
-            selected_idx.append(best_candidate)
-            remaining_idx.remove(best_candidate)
+        best_idx = int(mmr_scores.argmax())
+        selected_idx.append(best_idx)
+        selected_mask[best_idx] = True
+        max_similarity = np.maximum(max_similarity, similarity_row(best_idx))
     
     # Return selected articles in order of selection
     return [articles[i] for i in selected_idx]
@@ -298,6 +357,16 @@ def apply_mmr_diversity(articles: List[Dict], max_articles: int, lambda_param: f
 # MAIN SELECTION FUNCTION
 # ==============================================================================
 
+def _fetch_bodies(ids: List[str]) -> Dict[str, str]:
+    """Load full_body for the given article ids (one round trip)."""
+    if not ids:
+        return {}
+    
+    query = text("SELECT id, full_body FROM news_raw WHERE id = ANY(:ids)")
+    with engine.connect() as conn:
+        return dict(conn.execute(query, {"ids": list(ids)}).all())
+
+
 def select_articles(
     ticker: str,
     start_date: str,
@@ -328,20 +397,26 @@ def select_articles(
     """
     # Query database (using API-aligned field names)
     # Uses parameterized query to prevent SQL injection
+    # full_body is left out here and fetched only for the selected articles
+    # Deduplicates by (title, source) in SQL, keeping the most recent version
+    # (handles updates/corrections of the same article)
     query = text("""
-        SELECT
-            id, published_utc, published_date_utc,
-            title, url, source,
-            tickers, description, summary, tags, 
-            full_body, full_body_chars
-        FROM news_raw
-        WHERE source = 'finance.yahoo.com'
-          AND :ticker = ANY(tickers)
-          AND published_date_utc >= CAST(:start AS date)
-          AND published_date_utc < CAST(:end AS date)
-          AND fetch_status = 'ok'
-          AND full_body IS NOT NULL
-          AND full_body_chars >= :min_chars
+        SELECT * FROM (
+            SELECT DISTINCT ON (lower(coalesce(title, '')), source)
+                id, published_utc, published_date_utc,
+                title, url, source,
+                tickers, description, summary, tags, 
+                full_body_chars
+            FROM news_raw
+            WHERE source = 'finance.yahoo.com'
+              AND tickers @> ARRAY[CAST(:ticker AS text)]  -- GIN-indexable containment
+              AND published_date_utc >= CAST(:start AS date)
+              AND published_date_utc < CAST(:end AS date)
+              AND fetch_status = 'ok'
+              AND full_body IS NOT NULL
+              AND full_body_chars >= :min_chars
+            ORDER BY lower(coalesce(title, '')), source, published_utc DESC
+        ) latest
         ORDER BY published_utc
     """)
     
@@ -353,12 +428,12 @@ def select_articles(
         "min_chars": min_body_chars,
     }
     
-    # Execute query and load into pandas DataFrame
+    # Execute query and load rows as plain dicts (no DataFrame round trip)
     with engine.connect() as conn:
-        df = pd.read_sql(query, conn, params=params)
+        rows = [dict(r) for r in conn.execute(query, params).mappings()]
     
     # If no articles found, return empty list
-    if df.empty:
+    if not rows:
         return []
     
     # Normalize tags to list (keep for potential future use, though not used in scoring)
@@ -372,25 +447,17 @@ def select_articles(
             return [k.strip() for k in val.split(",") if k.strip()]
         return list(val) if hasattr(val, "__iter__") else []
     
-    df["tags"] = df["tags"].map(normalize_tags)
-    
-    # Deduplicate by (title, source), keep latest
-    # This handles cases where same article appears multiple times (updates, corrections)
-    dedup_key = df["title"].fillna("").str.lower() + "||" + df["source"].fillna("")
-    df = (
-        df.assign(_key=dedup_key)
-          .sort_values("published_utc")           # Sort by time (earliest first)
-          .drop_duplicates("_key", keep="last")   # Keep most recent version
-          .drop(columns=["_key"])                  # Remove temporary key column
-    )
+    for row in rows:
+        row["tags"] = normalize_tags(row["tags"])
     
     # Score all articles using 30/70 length/content approach
-    articles = df.to_dict(orient="records")
-    for article in articles:
-        article["__score"] = calculate_article_score(article)
+    articles = rows
+    scores = score_articles(articles)
+    for article, score in zip(articles, scores):
+        article["__score"] = float(score)
     
-    # Sort by score (highest first)
-    articles.sort(key=lambda x: x["__score"], reverse=True)
+    # Sort by score (highest first, ties keep publication order)
+    articles = [articles[i] for i in np.argsort(-scores, kind="stable")]
     
     # Apply diversity or just take top-N
     if use_mmr and max_articles:
@@ -400,8 +467,12 @@ def select_articles(
         # Just take top-scored articles (may have redundant content)
         final_articles = articles[:max_articles] if max_articles else articles
     
+    # Fetch full bodies only for the articles that survived selection
+    bodies = _fetch_bodies([article["id"] for article in final_articles])
+    
     # Remove internal score field before returning (clean output)
     return [
-        {k: v for k, v in article.items() if k != "__score"}
+        {**{k: v for k, v in article.items() if k != "__score"},
+         "full_body": bodies.get(article["id"])}
         for article in final_articles
     ]
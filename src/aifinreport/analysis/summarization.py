@@ -1,32 +1,79 @@
 # core/summarize/map_reduce.py
 
 from typing import List, Dict, Optional
-import re, textwrap
+import hashlib, re, textwrap
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+
+from aifinreport.cache import get_bytes, put_bytes
+from aifinreport.config import CACHE_DIR, LLM_MODEL, LLM_PROVIDER
 from aifinreport.llm.client import complete
 
 # Default tolerance for target length (±10%)
 LENGTH_TOLERANCE = 0.10
 
+# Precompiled patterns / strip set used on every article and bullet
+_PARA_SPLIT = re.compile(r"\n\s*\n")
+_NONWORD = re.compile(r"\W+")
+_BULLET_STRIP = " -•\t"
+
+# Bump when MAP_PROMPT_TMPL / REDUCE_ARTICLE_TMPL or bullet parsing change,
+# so cached bullets from older prompts are not reused
+PROMPT_VERSION = 1
+BULLET_CACHE_DIR = CACHE_DIR / "bullets"
+
+
+def _bullet_cache_key(kind: str, ticker: str, payload: str) -> str:
+    ident = f"v{PROMPT_VERSION}|{LLM_PROVIDER}|{LLM_MODEL}|{ticker}|{payload}"
+    return f"{kind}-{hashlib.sha256(ident.encode('utf-8')).hexdigest()}"
+
+
+def _bullet_cache_get(key: str) -> Optional[List[str]]:
+    data = get_bytes(BULLET_CACHE_DIR / f"{key}.json")
+    if data is None:
+        return None
+    try:
+        return orjson.loads(data)
+    except ValueError:
+        return None
+
+
+def _bullet_cache_put(key: str, bullets: List[str]) -> None:
+    put_bytes(BULLET_CACHE_DIR / f"{key}.json", orjson.dumps(bullets))
+
 
 def split_paragraphs(text: str) -> List[str]:
     """Split text on blank lines, keep substantial paragraphs."""
-    paras = [p.strip() for p in re.split(r"\n\s*\n", (text or "").strip())]
+    paras = [p.strip() for p in _PARA_SPLIT.split((text or "").strip())]
     return [p for p in paras if len(p) > 60]
 
 
 def group_paragraphs(paras: List[str], max_chars: int = 1800) -> List[str]:
-    """Group paragraphs into chunks without exceeding max_chars."""
-    chunks, cur = [], []
-    cur_len = 0
-    for p in paras:
-        if cur_len + len(p) + 2 > max_chars and cur:
-            chunks.append("\n\n".join(cur))
-            cur, cur_len = [], 0
-        cur.append(p)
-        cur_len += len(p) + 2
-    if cur:
-        chunks.append("\n\n".join(cur))
-    return chunks
+    """
+    Pack paragraphs into as few chunks as possible without exceeding max_chars.
+    
+    First-fit decreasing: longest paragraphs are placed first, each into the
+    first chunk with room left. Fewer chunks means fewer map-phase LLM calls.
+    Paragraphs keep their original order within a chunk, and chunks are
+    ordered by their earliest paragraph.
+    """
+    bins: List[List[int]] = []
+    loads: List[int] = []
+    
+    for i in sorted(range(len(paras)), key=lambda i: len(paras[i]), reverse=True):
+        size = len(paras[i]) + 2  # + paragraph separator
+        for b, load in enumerate(loads):
+            if load + size <= max_chars:
+                bins[b].append(i)
+                loads[b] += size
+                break
+        else:
+            bins.append([i])
+            loads.append(size)
+    
+    bins = sorted((sorted(b) for b in bins), key=lambda b: b[0])
+    return ["\n\n".join(paras[i] for i in b) for b in bins]
 
 
 MAP_PROMPT_TMPL = """You are an analyst. Extract 3-6 FACTUAL investor-relevant bullets from the text.
@@ -73,13 +120,24 @@ Consolidated bullets:
 """
 
 
-def map_article_to_bullets(body: str, ticker: str) -> List[str]:
+def map_article_to_bullets(
+    body: str,
+    ticker: str,
+    max_workers: int = 4,
+    use_cache: bool = True,
+) -> List[str]:
     """
     Map a single article body to key bullet points.
     
+    Chunks are sent to the LLM concurrently (the calls are network-bound);
+    results are collected in chunk order. Bullets are cached on disk by
+    (body hash, ticker, model, prompt version), so re-runs skip the LLM.
+    
     Args:
         body: Full article text
         ticker: Stock ticker symbol
+        max_workers: Max LLM calls in flight for this article
+        use_cache: Read/write the on-disk bullet cache
     
     Returns:
         List of bullet points (max 12)
@@ -88,36 +146,51 @@ def map_article_to_bullets(body: str, ticker: str) -> List[str]:
     if not paras:
         return []
     
+    key = _bullet_cache_key("map", ticker, body)
+    if use_cache:
+        cached = _bullet_cache_get(key)
+        if cached is not None:
+            return cached
+    
     chunks = group_paragraphs(paras, max_chars=1800)
     all_bullets: List[str] = []
     
-    for ch in chunks:
-        prompt = MAP_PROMPT_TMPL.format(ticker=ticker, chunk=ch)
-        out = complete(prompt)
-        
+    prompts = [MAP_PROMPT_TMPL.format(ticker=ticker, chunk=ch) for ch in chunks]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(prompts)))) as ex:
+        outs = list(ex.map(complete, prompts))
+    
+    for out in outs:
         # Collect lines that look like bullets
-        lines = [l.strip(" -•\t") for l in out.splitlines() if l.strip()]
+        lines = [l.strip(_BULLET_STRIP) for l in out.splitlines() if l.strip()]
         bullets = [l for l in lines if len(l) > 3]
         all_bullets.extend(bullets)
     
     # Simple deduplication
     seen, uniq = set(), []
     for b in all_bullets:
-        k = re.sub(r"\W+", " ", b.lower()).strip()
+        k = _NONWORD.sub(" ", b.lower()).strip()
         if k not in seen:
             seen.add(k)
             uniq.append(b)
     
-    return uniq[:12]
+    bullets = uniq[:12]
+    if use_cache:
+        _bullet_cache_put(key, bullets)
+    return bullets
 
 
-def reduce_articles_to_bullets(per_article_bullets: List[List[str]], ticker: str) -> List[str]:
+def reduce_articles_to_bullets(
+    per_article_bullets: List[List[str]],
+    ticker: str,
+    use_cache: bool = True,
+) -> List[str]:
     """
     Reduce multiple articles' bullets into consolidated list.
     
     Args:
         per_article_bullets: List of bullet lists, one per article
         ticker: Stock ticker symbol
+        use_cache: Read/write the on-disk bullet cache (keyed by the input bullets)
     
     Returns:
         Consolidated list of bullets (max 18)
@@ -126,24 +199,34 @@ def reduce_articles_to_bullets(per_article_bullets: List[List[str]], ticker: str
     if not flat:
         return []
     
+    bullets_text = "\n".join(f"- {b}" for b in flat)
+    key = _bullet_cache_key("reduce", ticker, bullets_text)
+    if use_cache:
+        cached = _bullet_cache_get(key)
+        if cached is not None:
+            return cached
+    
     prompt = REDUCE_ARTICLE_TMPL.format(
         ticker=ticker,
-        bullets="\n".join(f"- {b}" for b in flat)
+        bullets=bullets_text
     )
     out = complete(prompt)
     
     # Extract and deduplicate bullets
-    lines = [l.strip(" -•\t") for l in out.splitlines() if l.strip()]
+    lines = [l.strip(_BULLET_STRIP) for l in out.splitlines() if l.strip()]
     uniq = []
     seen = set()
     
     for b in lines:
-        k = re.sub(r"\W+", " ", b.lower()).strip()
+        k = _NONWORD.sub(" ", b.lower()).strip()
         if k and k not in seen:
             seen.add(k)
             uniq.append(b)
     
-    return uniq[:18]
+    bullets = uniq[:18]
+    if use_cache:
+        _bullet_cache_put(key, bullets)
+    return bullets
 
 
 def final_summary(
@@ -0,0 +1,28 @@
+"""On-disk cache files under CACHE_DIR: one file per key, best effort."""
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+def get_bytes(path: Path) -> Optional[bytes]:
+    """Read a cache file; None if it doesn't exist or can't be read."""
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def put_bytes(path: Path, data: bytes) -> None:
+    """
+    Write a cache file atomically (readers never see a partial file).
+
+    Failures are ignored: a missing cache entry only costs a recompute.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        pass
@@ -5,13 +5,7 @@ import os                               # Import the operating system interface
 import sys                              # Import system-specific parameters and functions (used for sys.argv for command-line args)
 import argparse                         # Import argument parser for creating user-friendly command-line interfaces
 from pathlib import Path                # Import Path class for object-oriented filesystem path handling (cross-platform)
-
-from aifinreport.analysis.selection import select_articles    # Import the article selection function that filters and ranks Yahoo Finance articles
-from aifinreport.analysis.summarization import (
-    map_article_to_bullets,
-    reduce_articles_to_bullets,
-    final_summary,
-)
+from concurrent.futures import ThreadPoolExecutor
 
 # --- env / paths ---
 
@@ -19,7 +13,19 @@ from aifinreport.analysis.summarization import (
 LENGTH_TOLERANCE = 0.10
 
 
+# --- concurrent map calls (LLM client caps total in-flight requests) ---
+MAP_WORKERS = 8
+
+
 def run(ticker: str, start: str, end: str, max_articles: int, target_summary_chars: int, min_body_chars: int):
+    # Imported here so `--help` doesn't pay for sqlalchemy/sklearn/LLM SDK imports
+    from aifinreport.analysis.selection import select_articles    # Import the article selection function that filters and ranks Yahoo Finance articles
+    from aifinreport.analysis.summarization import (
+        map_article_to_bullets,
+        reduce_articles_to_bullets,
+        final_summary,
+    )
+
     # Calculate acceptable range for summary length (±10%)
     min_summary_chars = int(target_summary_chars * (1 - LENGTH_TOLERANCE))
     max_summary_chars = int(target_summary_chars * (1 + LENGTH_TOLERANCE))
@@ -35,16 +41,13 @@ def run(ticker: str, start: str, end: str, max_articles: int, target_summary_cha
 
     
 
-    # 2) Map: per-article bullets
+    # 2) Map: per-article bullets (articles run concurrently, results keep selection order)
+    bodies = [r.get("full_body") for r in rows if r.get("full_body")]
     per_article_bullets = []
-    for r in rows:
-        body = r.get("full_body") or ""
-        if not body:
-            continue
-        bullets = map_article_to_bullets(body, ticker)
-        if bullets:
-            per_article_bullets.append(bullets)
-       
+    if bodies:
+        with ThreadPoolExecutor(max_workers=min(MAP_WORKERS, len(bodies))) as ex:
+            results = ex.map(lambda body: map_article_to_bullets(body, ticker), bodies)
+            per_article_bullets = [b for b in results if b]
 
     # 3) Reduce: consolidate bullets across articles
     consolidated = reduce_articles_to_bullets(per_article_bullets, ticker)
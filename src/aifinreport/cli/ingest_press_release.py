@@ -6,9 +6,7 @@ import sys
 import argparse
 from datetime import datetime
 from pathlib import Path
-import psycopg2
-from PyPDF2 import PdfReader
-from aifinreport.config import PG_DSN
+from aifinreport.database.connection import get_conn
 
 
 def extract_text_from_pdf(pdf_path: str) -> str:
@@ -21,6 +19,8 @@ def extract_text_from_pdf(pdf_path: str) -> str:
     Returns:
         Extracted text
     """
+    from PyPDF2 import PdfReader
+
     reader = PdfReader(pdf_path)
     text = ""
     
@@ -63,7 +63,7 @@ def store_press_release(
         related_call_id: ID of related earnings call
         source_file: Original file path
     """
-    with psycopg2.connect(PG_DSN) as conn:
+    with get_conn() as conn:
         with conn.cursor() as cur:
             # Insert into news_raw
             cur.execute("""
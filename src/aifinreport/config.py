@@ -10,6 +10,7 @@ load_dotenv(PROJECT_ROOT / ".env")
 # Paths
 BUILD_DIR = PROJECT_ROOT / "outputs"
 BUILD_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR = PROJECT_ROOT / ".cache"  # created on first write
 
 # Database
 PG_DSN = os.getenv("PG_DSN", "postgresql:///finreport")
@@ -25,6 +26,15 @@ LLM_MISTRAL_FALLBACKS = [
         "mistral-medium-latest,mistral-large-latest"
     ).split(",") if m.strip()
 ]
+# Max LLM requests in flight across all threads (keep under the provider rate limit)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+
+# Embeddings (news ranking)
+# "torch" (default) or "onnx" (CPU only; needs sentence-transformers>=3.2 and
+# optimum[onnxruntime]). EMBEDDING_ONNX_FILE picks a prebuilt variant from the
+# model repo, e.g. onnx/model_qint8_avx512_vnni.onnx for int8 on VNNI CPUs.
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+EMBEDDING_ONNX_FILE = os.getenv("EMBEDDING_ONNX_FILE")
 
 # Tiingo API
 TIINGO_API_TOKEN = os.getenv("TIINGO_API_TOKEN")
@@ -1,6 +1,58 @@
-"""Database connection using SQLAlchemy."""
+"""Database connections: SQLAlchemy engine and a shared psycopg2 pool."""
+import threading
+from contextlib import contextmanager
+
+from psycopg2.pool import ThreadedConnectionPool
 from sqlalchemy import create_engine
 from aifinreport.config import PG_DSN
 
 # Create SQLAlchemy engine
 engine = create_engine(PG_DSN)
+
+# psycopg2 pool (created on first use so importing this module never connects)
+POOL_MAXCONN = 16
+_pool = None
+_pool_lock = threading.Lock()
+
+# ThreadedConnectionPool raises PoolError when full instead of waiting;
+# one slot per connection makes get_conn() block until one is returned
+_pool_slots = threading.BoundedSemaphore(POOL_MAXCONN)
+
+
+def _get_pool() -> ThreadedConnectionPool:
+    """Create the shared connection pool on first use."""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(1, POOL_MAXCONN, PG_DSN)
+
+    return _pool
+
+
+@contextmanager
+def get_conn():
+    """
+    Borrow a pooled psycopg2 connection for one transaction.
+
+    Behaves like `with psycopg2.connect(PG_DSN) as conn:` (commit on
+    success, rollback on error) but hands the connection back to the
+    pool instead of paying a new connect on every call. When all
+    POOL_MAXCONN connections are borrowed, waits for one to be returned.
+
+    Example:
+        >>> with get_conn() as conn, conn.cursor() as cur:
+        ...     cur.execute("SELECT 1")
+    """
+    pool = _get_pool()
+    _pool_slots.acquire()
+    try:
+        conn = pool.getconn()
+        try:
+            with conn:
+                yield conn
+        finally:
+            pool.putconn(conn)
+    finally:
+        _pool_slots.release()
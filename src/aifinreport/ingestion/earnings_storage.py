@@ -2,9 +2,9 @@
 """
 Store parsed earnings call data in database.
 """
-import psycopg2
+from psycopg2.extras import execute_values
 from typing import Dict, Any
-from aifinreport.config import PG_DSN
+from aifinreport.database.connection import get_conn
 
 
 def store_earnings_call(
@@ -28,7 +28,7 @@ def store_earnings_call(
         call_start_utc: UTC timestamp of call start
         parsed_data: Output from parse_transcript_file()
     """
-    with psycopg2.connect(PG_DSN) as conn:
+    with get_conn() as conn:
         with conn.cursor() as cur:
             # 1. Insert earnings_calls record
             cur.execute("""
@@ -56,16 +56,9 @@ def store_earnings_call(
                 DELETE FROM call_interventions WHERE call_id = %s
             """, (call_id,))
             
-            # 3. Insert all interventions
-            for intervention in parsed_data['interventions']:
-                cur.execute("""
-                    INSERT INTO call_interventions (
-                        call_id, ticker, timestamp_utc, relative_seconds,
-                        relative_time, speaker_name, speaker_role, speaker_type,
-                        text, text_chars, sequence_order, is_qa_section,
-                        is_question, is_answer, question_id, analyst_firm
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
+            # 3. Insert all interventions (multi-row VALUES, one round trip per page)
+            rows = [
+                (
                     call_id,
                     ticker,
                     intervention['timestamp_utc'],
@@ -82,7 +75,17 @@ def store_earnings_call(
                     intervention.get('is_answer', False),
                     intervention.get('question_id'),
                     intervention.get('analyst_firm')
-                ))
+                )
+                for intervention in parsed_data['interventions']
+            ]
+            execute_values(cur, """
+                INSERT INTO call_interventions (
+                    call_id, ticker, timestamp_utc, relative_seconds,
+                    relative_time, speaker_name, speaker_role, speaker_type,
+                    text, text_chars, sequence_order, is_qa_section,
+                    is_question, is_answer, question_id, analyst_firm
+                ) VALUES %s
+            """, rows, page_size=1000)
             
             print(f"✅ Stored {len(parsed_data['interventions'])} interventions")
         
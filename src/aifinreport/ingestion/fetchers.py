@@ -1,20 +1,84 @@
 # src/aifinreport/ingestion/fetchers.py
 from __future__ import annotations
+import atexit
+import hashlib
 import httpx
+import orjson
 import trafilatura
 from readability import Document
 
+from aifinreport.cache import get_bytes, put_bytes
+from aifinreport.config import CACHE_DIR
+
 # A normal browser UA helps reduce 403s
 UA = ("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
       "(KHTML, like Gecko) Chrome/127.0 Safari/537.36")
 
-def fetch_article_text(url: str, timeout: int = 20) -> tuple[str | None, str | None]:
+# Shared, thread-safe client so body fetches reuse TCP/TLS connections
+_client = httpx.Client(
+    headers={"User-Agent": UA},
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+)
+atexit.register(_client.close)
+
+# Successful extractions, one JSON file per URL
+BODY_CACHE_DIR = CACHE_DIR / "bodies"
+
+
+def _cache_path(url: str):
+    return BODY_CACHE_DIR / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.json"
+
+
+def _cache_get(url: str) -> tuple[str, str] | None:
+    data = get_bytes(_cache_path(url))
+    if data is None:
+        return None
+    try:
+        text, extractor = orjson.loads(data)
+        return text, extractor
+    except ValueError:
+        return None
+
+
+def _cache_put(url: str, text: str, extractor: str) -> None:
+    put_bytes(_cache_path(url), orjson.dumps([text, extractor]))
+
+
+def cached_article_text(url: str) -> tuple[str, str] | None:
+    """
+    Look up a previously extracted article without touching the network.
+    Returns: (text, extractor_used), or None on a cache miss
+    """
+    return _cache_get(url)
+
+
+def fetch_article_text(
+    url: str,
+    timeout: int = 20,
+    use_cache: bool = True
+) -> tuple[str | None, str | None]:
     """
     Fetches a Yahoo Finance article and extracts clean text.
+    Successful extractions are cached on disk by URL, so re-runs over
+    overlapping days skip the download; failures are always retried.
     Returns: (text or None, extractor_used or None)
     """
+    if use_cache:
+        cached = _cache_get(url)
+        if cached:
+            return cached
+
+    text, extractor = _fetch_article_text(url, timeout)
+    if use_cache and text:
+        _cache_put(url, text, extractor)
+    return text, extractor
+
+
+def _fetch_article_text(url: str, timeout: int) -> tuple[str | None, str | None]:
+    """Download and extract one article (no caching)."""
     try:
-        r = httpx.get(url, headers={"User-Agent": UA}, timeout=timeout, follow_redirects=True)
+        r = _client.get(url, timeout=timeout)
         if r.status_code != 200:
             return None, f"http_{r.status_code}"
         html = r.text
@@ -3,13 +3,26 @@
 Generate simple extractive summaries using TF-IDF.
 No keyword boosting needed - content validation already ensures relevance.
 """
-from sklearn.feature_extraction.text import TfidfVectorizer
+import re
+
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 import numpy as np
 
+# Stateless term counter: hashes tokens instead of building a vocabulary per article
+_hasher = HashingVectorizer(
+    n_features=2**14,
+    alternate_sign=False,
+    norm=None,
+    stop_words='english',
+)
+
+# One line of >100 non-blank chars, captured without its surrounding whitespace
+_PARA_RE = re.compile(r"^[^\S\n]*(\S[^\n]{99,}\S)[^\S\n]*$", re.M)
+
 
 def split_into_paragraphs(text: str):
     """Split text into substantial paragraphs (>100 chars)."""
-    return [p.strip() for p in text.split("\n") if len(p.strip()) > 100]
+    return _PARA_RE.findall(text)
 
 
 def summarize_article(text: str, ticker: str = None):
@@ -26,6 +39,10 @@ def summarize_article(text: str, ticker: str = None):
     Returns:
         Summary text (top 2 paragraphs) or None if no content
     """
+    # Too short to hold a single >100-char paragraph: skip the regex + TF-IDF
+    if not text or len(text) <= 100:
+        return None
+    
     paras = split_into_paragraphs(text)
     if not paras:
         return None
@@ -33,13 +50,20 @@ def summarize_article(text: str, ticker: str = None):
     if len(paras) == 1:
         return paras[0]
     
-    # Score paragraphs using TF-IDF
-    vectorizer = TfidfVectorizer(stop_words='english')
-    X = vectorizer.fit_transform(paras)
-    scores = np.asarray(X.sum(axis=1)).ravel()
-    
-    # Rank by score and take top 2
-    ranked = [p for _, p in sorted(zip(scores, paras), reverse=True)]
-    summary = "\n\n".join(ranked[:2])
+    # Score paragraphs using TF-IDF (IDF is still fit on this article's paragraphs)
+    counts = _hasher.transform(paras)
+    X = TfidfTransformer().fit_transform(counts)
+
+    # Row sums straight from the CSR arrays (empty rows keep a score of 0)
+    row_nnz = np.diff(X.indptr)
+    scores = np.zeros(X.shape[0])
+    nonempty = row_nnz > 0
+    if nonempty.any():
+        scores[nonempty] = np.add.reduceat(X.data, X.indptr[:-1][nonempty])
+
+    # Take top 2 by score without sorting every paragraph
+    top2 = np.argpartition(-scores, 1)[:2]
+    top2 = top2[np.argsort(-scores[top2])]
+    summary = "\n\n".join(paras[i] for i in top2)
     
     return summary.strip()
\ No newline at end of file
@@ -7,25 +7,39 @@ Single-step ingestion: metadata + body + summary in one pass.
 Schema aligned with Tiingo API field names.
 """
 from __future__ import annotations
-import os
+import atexit
 import datetime as dt
+import functools
 import time
 from pathlib import Path
 from typing import Dict, Any, Iterable, Optional, List
 import re
+import asyncio
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
-import psycopg2
+import orjson
 from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 
-from aifinreport.ingestion.fetchers import fetch_article_text
-from aifinreport.config import TIINGO_API_TOKEN, PG_DSN
+from aifinreport.ingestion.fetchers import cached_article_text, fetch_article_text
+from aifinreport.cache import get_bytes, put_bytes
+from aifinreport.config import CACHE_DIR, TIINGO_API_TOKEN
+from aifinreport.database.connection import get_conn
 from aifinreport.ingestion.summarizers import summarize_article
 
 load_dotenv(dotenv_path=Path(__file__).resolve().parents[2] / ".env")
 BASE = "https://api.tiingo.com/tiingo/news"
 
+# Persistent client: keeps the Tiingo connection alive across fetch_news calls
+_CLIENT = httpx.Client(
+    timeout=60,
+    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+)
+atexit.register(_CLIENT.close)
+
 # Company name mappings for common tickers
 TICKER_COMPANY_NAMES = {
     "NVDA": ["nvidia", "nvda"],
@@ -37,7 +51,24 @@ TICKER_COMPANY_NAMES = {
     "META": ["meta", "facebook", "meta platforms"],
 }
 
+# Parenthesised ticker symbols in titles, e.g. "Rumble (RUM)"
+_CONFLICT_RE = re.compile(r'\(([A-Z]{2,5})\)')
+
+
+@functools.lru_cache(maxsize=1000)
+def _ticker_pattern(ticker_upper: str) -> re.Pattern:
+    """
+    Compile one case-insensitive pattern matching any search term for a ticker.
+    
+    Terms are matched as plain substrings; "$NVDA" and "(NVDA)" are covered
+    by the bare ticker, so only the ticker and company names are needed.
+    """
+    terms = {ticker_upper.lower(), *TICKER_COMPANY_NAMES.get(ticker_upper, [])}
+    alternatives = sorted((re.escape(t) for t in terms), key=len, reverse=True)
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
 
+@functools.lru_cache(maxsize=1024)
 def _utc_window(day_iso: str) -> tuple[str, str]:
     """Convert a date to UTC window: [YYYY-MM-DD, YYYY-MM-DD+1)"""
     d = dt.date.fromisoformat(day_iso)
@@ -69,38 +100,25 @@ def _validate_ticker_relevance(
         - reason: String explaining validation result
     """
     ticker_upper = ticker.upper()
+    pattern = _ticker_pattern(ticker_upper)
     
-    # Build search terms
-    ticker_variations = {
-        ticker_upper,
-        ticker.lower(),
-        f"${ticker_upper}",   # $NVDA
-        f"({ticker_upper})",  # (NVDA)
-    }
-    
-    # Add company names if known
-    company_names = set(TICKER_COMPANY_NAMES.get(ticker_upper, []))
-    search_terms = ticker_variations | company_names
-    
-    title = (article.get("title") or "").lower()
-    description = (article.get("description") or "").lower()
-    url = (article.get("url") or "").lower()
+    title = article.get("title") or ""
     
     # Check for conflicting ticker in title (e.g., "Rumble (RUM)" when expecting NVDA)
-    found_tickers = re.findall(r'\(([A-Z]{2,5})\)', article.get("title") or "")
+    found_tickers = _CONFLICT_RE.findall(title)
     if found_tickers and ticker_upper not in found_tickers:
         return False, f"title_mentions_different_ticker_{found_tickers[0]}"
     
     # Check 1: Title (most important)
-    if any(term.lower() in title for term in search_terms):
+    if pattern.search(title):
         return True, "ticker_in_title"
     
     # Check 2: Description (good signal)
-    if any(term.lower() in description for term in search_terms):
+    if pattern.search(article.get("description") or ""):
         return True, "ticker_in_description"
     
     # Check 3: URL (sometimes reliable)
-    if ticker.lower() in url:
+    if ticker.lower() in (article.get("url") or "").lower():
         return True, "ticker_in_url"
     
     # If strict mode and nothing found
@@ -111,6 +129,74 @@ def _validate_ticker_relevance(
     return True, "tiingo_tag_only"
 
 
+class _RateLimiter:
+    """Space out call starts by at least `interval` seconds across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _fetch_and_summarize(
+    article: Dict[str, Any],
+    ticker: str,
+    limiter: _RateLimiter
+) -> tuple:
+    """
+    Fetch one article body and summarize it (runs in a worker thread).
+    
+    Returns:
+        (full_body, full_body_chars, fetch_status, body_extractor, summary)
+    """
+    print(f"  Fetching body: {article.get('title', 'NO_TITLE')[:60]}...")
+    
+    # Only real downloads are rate limited; disk-cache hits return immediately
+    cached = cached_article_text(article["url"])
+    if cached:
+        full_body, extractor_or_error = cached
+    else:
+        limiter.wait()
+        full_body, extractor_or_error = fetch_article_text(article["url"])
+    
+    if not full_body:
+        fetch_status = extractor_or_error or "unknown_error"
+        print(f"    ✗ Body fetch failed: {fetch_status}")
+        return None, 0, fetch_status, None, None
+    
+    # Generate summary
+    try:
+        summary = summarize_article(full_body, ticker)
+    except Exception as e:
+        print(f"    ⚠️  Summary generation failed: {e}")
+        summary = None
+    
+    print(f"    ✓ Body fetched: {len(full_body)} chars, extractor: {extractor_or_error}")
+    return full_body, len(full_body), "ok", extractor_or_error, summary
+
+
+def _news_params(ticker: Optional[str], day_iso: str, limit: int) -> Dict[str, Any]:
+    """Build Tiingo /news query params for one ticker-day."""
+    startDate, endDate = _utc_window(day_iso)
+    params: Dict[str, Any] = {
+        "startDate": startDate,
+        "endDate": endDate,
+        "limit": limit,
+        "token": TIINGO_API_TOKEN,
+    }
+    if ticker:
+        params["tickers"] = ticker.lower()
+    return params
+
+
 def fetch_news(
     ticker: Optional[str],
     day_iso: str,
@@ -119,6 +205,7 @@ def fetch_news(
     strict_validation: bool = True,
     fetch_bodies: bool = True,
     body_fetch_delay: float = 1.0,
+    max_workers: int = 8,
 ) -> Iterable[Dict[str, Any]]:
     """
     Fetch news from Tiingo API for a specific ticker and date.
@@ -131,21 +218,105 @@ def fetch_news(
         validate_content: If True, validate ticker appears in content
         strict_validation: If True, require explicit content mention
         fetch_bodies: If True, fetch full article bodies from URLs
-        body_fetch_delay: Delay in seconds between body fetches (rate limiting)
+        body_fetch_delay: Minimum spacing in seconds between body fetch starts (rate limiting)
+        max_workers: Number of body fetches allowed in flight at once
     
     Yields:
         Normalized article dictionaries ready for database insertion
     """
-    startDate, endDate = _utc_window(day_iso)
-    params: Dict[str, Any] = {
-        "startDate": startDate,
-        "endDate": endDate,
-        "limit": limit,
-        "token": TIINGO_API_TOKEN,
-    }
-    if ticker:
-        params["tickers"] = ticker.lower()
+    r = _CLIENT.get(BASE, params=_news_params(ticker, day_iso, limit))
+    r.raise_for_status()
+    payload = orjson.loads(r.content) or []
+
+    yield from process_news(
+        payload,
+        ticker,
+        validate_content=validate_content,
+        strict_validation=strict_validation,
+        fetch_bodies=fetch_bodies,
+        body_fetch_delay=body_fetch_delay,
+        max_workers=max_workers,
+    )
+
+
+async def _fetch_payloads(
+    pairs: List[tuple[Optional[str], str]],
+    limit: int,
+    max_connections: int,
+) -> List[Any]:
+    """GET every (ticker, day) page concurrently; failures come back as exceptions."""
+    limits = httpx.Limits(max_connections=max_connections)
+    async with httpx.AsyncClient(timeout=60, limits=limits) as client:
+        async def one(ticker, day_iso):
+            r = await client.get(BASE, params=_news_params(ticker, day_iso, limit))
+            r.raise_for_status()
+            return orjson.loads(r.content) or []
+
+        return await asyncio.gather(
+            *(one(t, d) for t, d in pairs), return_exceptions=True
+        )
+
+
+def fetch_news_many(
+    tickers: List[str],
+    days: List[str],
+    limit: int = 1000,
+    max_connections: int = 8,
+    failures: Optional[List[tuple[str, str]]] = None,
+    **kwargs,
+) -> Iterable[Dict[str, Any]]:
+    """
+    Fetch news for several tickers and/or days, issuing the Tiingo
+    requests concurrently, then process each page like fetch_news.
+    
+    Args:
+        tickers: Ticker symbols (e.g., ["NVDA", "AAPL"])
+        days: Dates in YYYY-MM-DD format (UTC)
+        limit: Max articles per ticker-day from API
+        max_connections: Max concurrent Tiingo requests
+        failures: Optional list; (ticker, day) pairs whose request failed are appended
+        **kwargs: Processing options passed to process_news
+    
+    Yields:
+        Normalized article dictionaries ready for database insertion
+    """
+    pairs = [(t, d) for d in days for t in tickers]
+    payloads = asyncio.run(_fetch_payloads(pairs, limit, max_connections))
+    
+    for (ticker, day_iso), payload in zip(pairs, payloads):
+        if isinstance(payload, Exception):
+            print(f"⚠️  Tiingo request failed for {ticker} {day_iso}: {payload}")
+            if failures is not None:
+                failures.append((ticker, day_iso))
+            continue
+        print(f"\n📰 {ticker} {day_iso}: {len(payload)} articles from Tiingo")
+        yield from process_news(payload, ticker, **kwargs)
+
 
+def process_news(
+    payload: List[Dict[str, Any]],
+    ticker: Optional[str],
+    validate_content: bool = True,
+    strict_validation: bool = True,
+    fetch_bodies: bool = True,
+    body_fetch_delay: float = 1.0,
+    max_workers: int = 8,
+) -> Iterable[Dict[str, Any]]:
+    """
+    Filter, validate and enrich one Tiingo /news response.
+    
+    Args:
+        payload: Parsed Tiingo /news response (list of article dicts)
+        ticker: Ticker symbol the page was requested for, or None
+        validate_content: If True, validate ticker appears in content
+        strict_validation: If True, require explicit content mention
+        fetch_bodies: If True, fetch full article bodies from URLs
+        body_fetch_delay: Minimum spacing in seconds between body fetch starts (rate limiting)
+        max_workers: Number of body fetches allowed in flight at once
+    
+    Yields:
+        Normalized article dictionaries ready for database insertion
+    """
     # Statistics
     validation_rejected = 0
     validation_accepted = 0
@@ -153,91 +324,70 @@ def fetch_news(
     body_fetch_failed = 0
     rejected_articles = []
 
-    with httpx.Client(timeout=60) as client:
-        r = client.get(BASE, params=params)
-        r.raise_for_status()
+    # Pass 1: filter + validate (cheap, no network)
+    kept = []
+    for x in payload:
+        # Normalize source + tickers (keep API field names)
+        source_domain = (x.get("source") or "").strip().lower()
+        tickers_raw = x.get("tickers") or []
+        tickers = sorted({t.upper() for t in tickers_raw})
+
+        # --- FILTER RULES ---
+        # 1) Only Yahoo Finance
+        if source_domain != "finance.yahoo.com":
+            continue
         
-        article_count = 0
-        for x in (r.json() or []):
-            # Normalize source + tickers (keep API field names)
-            source_domain = (x.get("source") or "").strip().lower()
-            tickers_raw = x.get("tickers") or []
-            tickers = sorted({t.upper() for t in tickers_raw})
-
-            # --- FILTER RULES ---
-            # 1) Only Yahoo Finance
-            if source_domain != "finance.yahoo.com":
+        # 2) Only single-ticker articles that match requested ticker
+        if ticker:
+            if not (len(tickers) == 1 and tickers[0] == ticker.upper()):
+                continue
+        else:
+            # If no ticker specified, still require single-ticker
+            if len(tickers) != 1:
                 continue
+
+        # 3) CONTENT VALIDATION - verify ticker actually appears in content
+        validation_status = "passed"
+        validation_reason = "no_validation"
+        
+        if validate_content and ticker:
+            is_valid, reason = _validate_ticker_relevance(
+                x, ticker, strict=strict_validation
+            )
+            validation_status = "passed" if is_valid else "failed"
+            validation_reason = reason
             
-            # 2) Only single-ticker articles that match requested ticker
-            if ticker:
-                if not (len(tickers) == 1 and tickers[0] == ticker.upper()):
-                    continue
-            else:
-                # If no ticker specified, still require single-ticker
-                if len(tickers) != 1:
-                    continue
-
-            # 3) CONTENT VALIDATION - verify ticker actually appears in content
-            validation_status = "passed"
-            validation_reason = "no_validation"
+            if not is_valid:
+                validation_rejected += 1
+                rejected_articles.append({
+                    "title": x.get("title", "NO_TITLE")[:80],
+                    "reason": reason,
+                    "url": x.get("url", "NO_URL"),
+                })
+                continue
             
-            if validate_content and ticker:
-                is_valid, reason = _validate_ticker_relevance(
-                    x, ticker, strict=strict_validation
-                )
-                validation_status = "passed" if is_valid else "failed"
-                validation_reason = reason
-                
-                if not is_valid:
-                    validation_rejected += 1
-                    rejected_articles.append({
-                        "title": x.get("title", "NO_TITLE")[:80],
-                        "reason": reason,
-                        "url": x.get("url", "NO_URL"),
-                    })
-                    continue
-                
-                validation_accepted += 1
-
-            # 4) FETCH FULL BODY (if enabled)
-            full_body = None
-            full_body_chars = 0
-            fetch_status = "not_fetched"
-            body_extractor = None
-            summary = None
+            validation_accepted += 1
+
+        kept.append((x, source_domain, tickers, validation_status, validation_reason))
+
+    # 4) FETCH FULL BODIES + summaries concurrently (network-bound)
+    def _body(item):
+        x, _, tickers, _, _ = item
+        if not fetch_bodies or not x.get("url"):
+            return None, 0, "not_fetched", None, None
+        return _fetch_and_summarize(x, ticker or tickers[0], limiter)
+
+    limiter = _RateLimiter(body_fetch_delay)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        # ex.map keeps the API order of articles
+        for item, body in zip(kept, ex.map(_body, kept)):
+            x, source_domain, tickers, validation_status, validation_reason = item
+            full_body, full_body_chars, fetch_status, body_extractor, summary = body
             
-            if fetch_bodies:
-                article_url = x.get("url")
-                if article_url:
-                    # Rate limiting: delay between fetches
-                    if article_count > 0:
-                        time.sleep(body_fetch_delay)
-                    
-                    print(f"  Fetching body [{validation_accepted}]: {x.get('title', 'NO_TITLE')[:60]}...")
-                    
-                    full_body, extractor_or_error = fetch_article_text(article_url)
-                    
-                    if full_body:
-                        # Success
-                        full_body_chars = len(full_body)
-                        fetch_status = "ok"
-                        body_extractor = extractor_or_error
-                        body_fetch_ok += 1
-                        
-                        # Generate summary
-                        try:
-                            summary = summarize_article(full_body, ticker or tickers[0])
-                        except Exception as e:
-                            print(f"    ⚠️  Summary generation failed: {e}")
-                            summary = None
-                        
-                        print(f"    ✓ Body fetched: {full_body_chars} chars, extractor: {body_extractor}")
-                    else:
-                        # Failed
-                        fetch_status = extractor_or_error or "unknown_error"
-                        body_fetch_failed += 1
-                        print(f"    ✗ Body fetch failed: {fetch_status}")
+            if fetch_status == "ok":
+                body_fetch_ok += 1
+            elif fetch_status != "not_fetched":
+                body_fetch_failed += 1
 
             # 5) Yield complete article record (API-aligned field names)
             yield {
@@ -258,8 +408,6 @@ def fetch_news(
                 "body_extractor": body_extractor,
                 "summary": summary,
             }
-            
-            article_count += 1
     
     # Print summary
     print(f"\n{'='*60}")
@@ -289,50 +437,15 @@ def fetch_news(
     print(f"{'='*60}\n")
 
 
-def upsert_news(items: Iterable[Dict[str, Any]]) -> int:
-    """
-    Upsert news articles into PostgreSQL database.
-    Uses API-aligned field names.
-    
-    Args:
-        items: Iterable of article dictionaries
-    
-    Returns:
-        Number of rows upserted
-    """
-    rows: List[tuple] = []
-    for x in items:
-        if not x.get("id") or not x.get("published_utc"):
-            continue
-        rows.append((
-            x["id"],
-            x["published_utc"],
-            x.get("crawl_date"),
-            x.get("title"),
-            x.get("url"),
-            x.get("description"),
-            x.get("source"),
-            x.get("tickers"),
-            x.get("tags"),
-            x.get("validation_status"),
-            x.get("validation_reason"),
-            x.get("full_body"),
-            x.get("full_body_chars"),
-            x.get("fetch_status"),
-            x.get("body_extractor"),
-            x.get("summary"),
-        ))
-    
-    if not rows:
-        print("upserted: 0")
-        return 0
+# news_raw columns written by upsert_news, in INSERT order
+_UPSERT_COLUMNS = (
+    "id", "published_utc", "crawl_date", "title", "url", "description",
+    "source", "tickers", "tags", "validation_status", "validation_reason",
+    "full_body", "full_body_chars", "fetch_status", "body_extractor", "summary",
+)
+_COLUMN_LIST = ", ".join(_UPSERT_COLUMNS)
 
-    sql = """
-    INSERT INTO news_raw
-      (id, published_utc, crawl_date, title, url, description,
-       source, tickers, tags, validation_status, validation_reason,
-       full_body, full_body_chars, fetch_status, body_extractor, summary)
-    VALUES %s
+_ON_CONFLICT = """
     ON CONFLICT (id) DO UPDATE SET
       published_utc = EXCLUDED.published_utc,
       crawl_date    = EXCLUDED.crawl_date,
@@ -348,37 +461,238 @@ def upsert_news(items: Iterable[Dict[str, Any]]) -> int:
       full_body_chars = EXCLUDED.full_body_chars,
       fetch_status  = EXCLUDED.fetch_status,
       body_extractor = EXCLUDED.body_extractor,
-      summary       = EXCLUDED.summary;
+      summary       = EXCLUDED.summary
+"""
+
+# Above this many rows, COPY into a staging table beats multi-row INSERTs
+COPY_THRESHOLD = 2000
+
+
+def _pg_array(values) -> Optional[str]:
+    """Render a list of strings as a Postgres text[] literal for COPY."""
+    if values is None:
+        return None
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"') for v in values)
+    return "{" + ",".join(f'"{v}"' for v in escaped) + "}"
+
+
+def _csv_field(v) -> str:
+    """One COPY csv field: NULL is an unquoted empty field, text is always quoted."""
+    if v is None:
+        return ""
+    if isinstance(v, int):
+        return str(v)
+    return '"' + str(v).replace('"', '""') + '"'
+
+
+def _copy_buffer(rows: List[tuple]) -> io.StringIO:
+    """
+    Encode upsert rows as CSV for COPY ... WITH (FORMAT csv).
+    
+    CSV COPY reads only an unquoted empty field as NULL, so quoting every
+    string keeps '' (or any other text) distinct from NULL.
+    """
+    tickers_i = _UPSERT_COLUMNS.index("tickers")
+    tags_i = _UPSERT_COLUMNS.index("tags")
+    
+    buf = io.StringIO()
+    for row in rows:
+        row = list(row)
+        row[tickers_i] = _pg_array(row[tickers_i])
+        row[tags_i] = _pg_array(row[tags_i])
+        buf.write(",".join(map(_csv_field, row)))
+        buf.write("\n")
+    buf.seek(0)
+    return buf
+
+
+def _copy_upsert(cur, rows: List[tuple]) -> None:
+    """
+    Bulk upsert via COPY into a temp staging table, then one INSERT ... SELECT.
+    
+    COPY skips per-row statement parsing, which dominates for large batches.
+    """
+    buf = _copy_buffer(rows)
+    
+    cur.execute(f"""
+        CREATE TEMP TABLE news_stage ON COMMIT DROP AS
+        SELECT {_COLUMN_LIST} FROM news_raw WITH NO DATA
+    """)
+    cur.copy_expert(
+        f"COPY news_stage ({_COLUMN_LIST}) FROM STDIN WITH (FORMAT csv)",
+        buf,
+    )
+    cur.execute(f"""
+        INSERT INTO news_raw ({_COLUMN_LIST})
+        SELECT {_COLUMN_LIST} FROM news_stage
+        {_ON_CONFLICT}
+    """)
+
+
+def upsert_news(items: Iterable[Dict[str, Any]]) -> int:
+    """
+    Upsert news articles into PostgreSQL database.
+    Uses API-aligned field names.
+    
+    Args:
+        items: Iterable of article dictionaries
+    
+    Returns:
+        Number of rows upserted
     """
+    rows: List[tuple] = [
+        tuple(map(x.get, _UPSERT_COLUMNS))
+        for x in items
+        if x.get("id") and x.get("published_utc")
+    ]
     
-    with psycopg2.connect(PG_DSN) as conn, conn.cursor() as cur:
-        execute_values(cur, sql, rows, page_size=500)
+    if not rows:
+        print("upserted: 0")
+        return 0
+
+    with get_conn() as conn, conn.cursor() as cur:
+        if len(rows) > COPY_THRESHOLD:
+            _copy_upsert(cur, rows)
+        else:
+            # At most COPY_THRESHOLD rows here: page_size sends them as one INSERT
+            execute_values(
+                cur,
+                f"INSERT INTO news_raw ({_COLUMN_LIST}) VALUES %s {_ON_CONFLICT}",
+                rows,
+                page_size=COPY_THRESHOLD,
+            )
     
     print(f"upserted: {len(rows)}")
     return len(rows)
 
 
+# Record of completed (day, ticker) ingestions, so re-runs can skip them
+INGEST_CACHE_PATH = CACHE_DIR / "ingest_cache.json"
+
+
+def _load_ingest_cache() -> Dict[str, Any]:
+    data = get_bytes(INGEST_CACHE_PATH)
+    if data is None:
+        return {}
+    try:
+        return orjson.loads(data)
+    except ValueError:
+        return {}
+
+
+def _save_ingest_cache(cache: Dict[str, Any]) -> None:
+    put_bytes(INGEST_CACHE_PATH, orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+
+
+def ingest(
+    day_iso: str,
+    tickers: List[str],
+    fetch_bodies: bool = True,
+    force: bool = False,
+) -> int:
+    """
+    Fetch, validate, enrich and upsert one day of news for the given tickers.
+    
+    In-process entry point for scripts and schedulers (no interpreter spawn
+    per ticker); several tickers are fetched concurrently. Ticker-days already
+    ingested (recorded in CACHE_DIR/ingest_cache.json) are skipped unless
+    force=True; a body-less run does not satisfy a later run with bodies.
+    Only days already over in UTC are recorded, and a ticker-day with failed
+    body fetches is retried on the next run.
+    
+    Args:
+        day_iso: Date in YYYY-MM-DD format (UTC)
+        tickers: Ticker symbols (e.g., ["NVDA", "AAPL"])
+        fetch_bodies: If True, fetch full article bodies and summaries
+        force: If True, ignore the ingest cache and re-fetch everything
+    
+    Returns:
+        Number of rows upserted
+    """
+    # Articles carry upper-case tickers: match them (and the cache keys)
+    tickers = [t.upper() for t in tickers]
+    cache = _load_ingest_cache()
+    
+    def done(ticker: str) -> bool:
+        entry = cache.get(f"{day_iso}:{ticker}")
+        return (
+            bool(entry)
+            and entry.get("status") == "ok"
+            and (entry.get("fetch_bodies") or not fetch_bodies)
+        )
+    
+    todo = tickers if force else [t for t in tickers if not done(t)]
+    skipped = [t for t in tickers if t not in todo]
+    if skipped:
+        print(f"⏭️  Already ingested for {day_iso}: {', '.join(skipped)} (use --force to re-fetch)")
+    if not todo:
+        return 0
+    
+    options = dict(
+        validate_content=True,
+        strict_validation=True,
+        fetch_bodies=fetch_bodies,
+        body_fetch_delay=1.0,
+    )
+    
+    # Tally rows (and failed body fetches) per ticker as they stream into the upsert
+    counts = {t: 0 for t in todo}
+    failed_bodies = {t: 0 for t in todo}
+    failures: List[tuple[str, str]] = []
+    
+    def tally(items):
+        for item in items:
+            body_failed = item.get("fetch_status") not in ("ok", "not_fetched")
+            for t in item.get("tickers") or []:
+                if t in counts:
+                    counts[t] += 1
+                    failed_bodies[t] += body_failed
+            yield item
+    
+    if len(todo) == 1:
+        items = fetch_news(todo[0], day_iso, **options)
+    else:
+        items = fetch_news_many(todo, [day_iso], failures=failures, **options)
+    n = upsert_news(tally(items))
+    
+    # A day that isn't over in UTC can still gain articles: don't record it
+    now = dt.datetime.now(dt.timezone.utc)
+    if day_iso >= now.date().isoformat():
+        return n
+    
+    failed = {t for t, _ in failures}
+    fetched_at = now.isoformat()
+    for t in todo:
+        if t not in failed:
+            cache[f"{day_iso}:{t}"] = {
+                "status": "partial" if failed_bodies[t] else "ok",
+                "row_count": counts[t],
+                "failed_bodies": failed_bodies[t],
+                "fetch_bodies": fetch_bodies,
+                "fetched_at": fetched_at,
+            }
+    _save_ingest_cache(cache)
+    
+    return n
+
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) < 3:
-        print("Usage: python -m aifinreport.ingestion.tiingo YYYY-MM-DD TICKER [--no-bodies]")
+        print("Usage: python -m aifinreport.ingestion.tiingo YYYY-MM-DD TICKER[,TICKER...] [--no-bodies] [--force]")
         print("Example: python -m aifinreport.ingestion.tiingo 2025-10-03 NVDA")
+        print("         python -m aifinreport.ingestion.tiingo 2025-10-03 NVDA,AAPL,MSFT")
         print("         python -m aifinreport.ingestion.tiingo 2025-10-03 NVDA --no-bodies")
         raise SystemExit(2)
     
-    day, tkr = sys.argv[1], sys.argv[2]
+    day = sys.argv[1]
+    tickers = [t.strip().upper() for t in sys.argv[2].split(",") if t.strip()]
     fetch_bodies = "--no-bodies" not in sys.argv
+    force = "--force" in sys.argv
     
-    print(f"Fetching {tkr} news for {day}...")
+    print(f"Fetching {', '.join(tickers)} news for {day}...")
     print(f"Content validation: ON")
     print(f"Body fetching: {'ON' if fetch_bodies else 'OFF'}")
     print()
     
-    upsert_news(fetch_news(
-        tkr, 
-        day, 
-        validate_content=True, 
-        strict_validation=True,
-        fetch_bodies=fetch_bodies,
-        body_fetch_delay=1.0,
-    ))
\ No newline at end of file
+    ingest(day, tickers, fetch_bodies=fetch_bodies, force=force)
@@ -1,6 +1,6 @@
-from aifinreport.config import LLM_PROVIDER, MISTRAL_API_KEY, OPENAI_API_KEY, LLM_MODEL, LLM_MISTRAL_FALLBACKS
+from aifinreport.config import LLM_PROVIDER, MISTRAL_API_KEY, OPENAI_API_KEY, LLM_MODEL, LLM_MISTRAL_FALLBACKS, LLM_MAX_CONCURRENCY
 # core/llm/llm.py
-import os, time
+import os, time, threading
 from typing import Optional
 
 # --- Mistral ---
@@ -22,11 +22,32 @@ except Exception:
 # preferred models
 
 
+# Clients are built once and reused, so their HTTP connection pools persist
+_mistral_client = None
+_openai_client = None
+
+# Callers fan out over threads (articles x chunks); cap total in-flight requests
+_inflight = threading.BoundedSemaphore(max(1, LLM_MAX_CONCURRENCY))
+
+
+def _get_mistral_client():
+    global _mistral_client
+    if _mistral_client is None:
+        _mistral_client = Mistral(api_key=MISTRAL_API_KEY)
+    return _mistral_client
+
+
+def _get_openai_client():
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAIClient(api_key=OPENAI_API_KEY)
+    return _openai_client
+
 
 def _complete_mistral(prompt: str, model: str, max_retries=4, base_sleep=1.0) -> Optional[str]:
     if not (Mistral and MISTRAL_API_KEY):
         return None
-    client = Mistral(api_key=MISTRAL_API_KEY)
+    client = _get_mistral_client()
 
     for attempt in range(max_retries):
         try:
@@ -48,7 +69,7 @@ def _complete_mistral(prompt: str, model: str, max_retries=4, base_sleep=1.0) ->
 def _complete_openai(prompt: str) -> Optional[str]:
     if not (OPENAI_API_KEY and OpenAIClient):
         return None
-    client = OpenAIClient(api_key=OPENAI_API_KEY)
+    client = _get_openai_client()
     resp = client.responses.create(
         model=OPENAI_MODEL,
         input=prompt,
@@ -63,7 +84,14 @@ def complete(prompt: str) -> str:
       1) If LLM_PROVIDER=mistral: try primary model w/ retries, then Mistral fallbacks.
       2) If that fails and OPENAI is available, try OpenAI.
       3) If LLM_PROVIDER=openai: go straight to OpenAI.
+    
+    Thread-safe; at most LLM_MAX_CONCURRENCY calls run at once.
     """
+    with _inflight:
+        return _complete(prompt)
+
+
+def _complete(prompt: str) -> str:
     if LLM_PROVIDER == "mistral":
         # try primary
         out = _complete_mistral(prompt, LLM_MODEL)
@@ -4,9 +4,9 @@ Database tools for querying earnings call data.
 
 
 import psycopg2
-from datetime import datetime
-from typing import Dict, Optional
-from aifinreport.config import PG_DSN
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+from aifinreport.database.connection import get_conn
 
 
 def get_earnings_call(call_id: str) -> Dict:
@@ -42,7 +42,7 @@ def get_earnings_call(call_id: str) -> Dict:
     """
     
     try:
-        with psycopg2.connect(PG_DSN) as conn:
+        with get_conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, (call_id,))
                 result = cur.fetchone()
@@ -75,13 +75,78 @@ def get_earnings_call(call_id: str) -> Dict:
     
     except psycopg2.Error as e:
         raise psycopg2.Error(f"Database error: {e}")
+
+
+def get_earnings_calls(call_ids: List[str]) -> Dict[str, Dict]:
+    """
+    Retrieve metadata for many earnings calls in one query.
+    
+    Batch runs pay one round trip for all calls instead of one per call.
+    
+    Args:
+        call_ids: Unique identifiers (e.g., ['earnings:nvda:q2-fy2026', ...])
+    
+    Returns:
+        Dict mapping call_id -> metadata (same shape as get_earnings_call);
+        unknown ids are left out
+    
+    Raises:
+        psycopg2.Error: If database connection fails
+    
+    Example:
+        >>> calls = get_earnings_calls(["earnings:nvda:q2-fy2026", "earnings:nvda:q3-fy2026"])
+        >>> print(sorted(calls))
+    """
+    ids = list(dict.fromkeys(call_ids))
+    if not ids:
+        return {}
+    
+    query = """
+        SELECT
+            c.id,
+            c.ticker,
+            c.fiscal_quarter,
+            c.fiscal_year,
+            c.call_date,
+            c.call_start_utc,
+            c.press_release_time_utc,
+            (SELECT COUNT(*) FROM call_interventions i WHERE i.call_id = c.id)
+        FROM earnings_calls c
+        WHERE c.id = ANY(%s)
+    """
+    
+    try:
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (ids,))
+                results = cur.fetchall()
+    
+    except psycopg2.Error as e:
+        raise psycopg2.Error(f"Database error: {e}")
     
-def get_prepared_remarks(call_id: str) -> list:
+    calls = {}
+    for row in results:
+        calls[row[0]] = {
+            'id': row[0],
+            'ticker': row[1],
+            'fiscal_quarter': row[2],
+            'fiscal_year': row[3],
+            'call_date': row[4],
+            'call_start_utc': row[5],
+            'press_release_time_utc': row[6],
+            'total_interventions': row[7]
+        }
+    
+    return calls
+
+
+def get_prepared_remarks(call_id: str, call: Optional[Dict] = None) -> list:
     """
     Retrieve prepared remarks (non-Q&A interventions) from earnings call.
     
     Args:
         call_id: Unique identifier (e.g., 'earnings:nvda:q2-fy2026')
+        call: Already-loaded get_earnings_call() result (skips the lookup)
     
     Returns:
         List of intervention dictionaries in chronological order
@@ -96,7 +161,8 @@ def get_prepared_remarks(call_id: str) -> list:
         >>> print(remarks[0]["speaker_name"])  # First speaker
     """
     # Verify call exists
-    _ = get_earnings_call(call_id)  # Raises ValueError if not found
+    if call is None:
+        _ = get_earnings_call(call_id)  # Raises ValueError if not found
     
     query = """
         SELECT 
@@ -115,7 +181,7 @@ def get_prepared_remarks(call_id: str) -> list:
     """
     
     try:
-        with psycopg2.connect(PG_DSN) as conn:
+        with get_conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, (call_id,))
                 results = cur.fetchall()
@@ -138,12 +204,13 @@ def get_prepared_remarks(call_id: str) -> list:
     except psycopg2.Error as e:
         raise psycopg2.Error(f"Database error: {e}")
 
-def get_qa_section(call_id: str) -> list:
+def get_qa_section(call_id: str, call: Optional[Dict] = None) -> list:
     """
     Retrieve Q&A section (questions and answers) from earnings call.
     
     Args:
         call_id: Unique identifier (e.g., 'earnings:nvda:q2-fy2026')
+        call: Already-loaded get_earnings_call() result (skips the lookup)
     
     Returns:
         List of Q&A intervention dictionaries in chronological order
@@ -158,7 +225,8 @@ def get_qa_section(call_id: str) -> list:
         >>> print(f"Found {len(questions)} analyst questions")
     """
     # Verify call exists
-    _ = get_earnings_call(call_id)  # Raises ValueError if not found
+    if call is None:
+        _ = get_earnings_call(call_id)  # Raises ValueError if not found
     
     query = """
         SELECT 
@@ -181,7 +249,7 @@ def get_qa_section(call_id: str) -> list:
     """
     
     try:
-        with psycopg2.connect(PG_DSN) as conn:
+        with get_conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, (call_id,))
                 results = cur.fetchall()
@@ -246,7 +314,7 @@ def search_news(
             tickers,
             full_body
         FROM news_raw
-        WHERE %s = ANY(tickers)
+        WHERE tickers @> ARRAY[%s]::text[]  -- containment: can use the GIN index on tickers
           AND published_utc >= %s
           AND published_utc <= %s
         ORDER BY published_utc DESC
@@ -259,7 +327,7 @@ def search_news(
         params.append(limit)
     
     try:
-        with psycopg2.connect(PG_DSN) as conn:
+        with get_conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, params)
                 results = cur.fetchall()
@@ -283,6 +351,126 @@ def search_news(
         raise psycopg2.Error(f"Database error: {e}")
 
 
+# News windows relative to the call start: name -> (start offset, end offset)
+NEWS_WINDOWS = {
+    "pre-call": (timedelta(days=-7), timedelta(0)),
+    "post-24h": (timedelta(0), timedelta(hours=24)),
+}
+
+
+def search_news_around_call(
+    call_id: str,
+    time_window: str = "pre-call",
+    limit: int = None,
+    call: Optional[Dict] = None
+) -> list:
+    """
+    Search news for the call's ticker in a window around the call start.
+    
+    Args:
+        call_id: Unique identifier (e.g., 'earnings:nvda:q2-fy2026')
+        time_window: One of NEWS_WINDOWS ("pre-call": 7 days before the call,
+            "post-24h": 24 hours after the call start)
+        limit: Optional limit on number of articles
+        call: Already-loaded get_earnings_call() result (skips the lookup)
+    
+    Returns:
+        List of news article dictionaries, ordered by published_utc DESC
+    
+    Raises:
+        ValueError: If call_id or time_window is unknown
+    
+    Example:
+        >>> news = search_news_around_call("earnings:nvda:q2-fy2026", "post-24h")
+        >>> print(f"Found {len(news)} articles after the call")
+    """
+    return search_news_around_call_multi(call_id, [(time_window, limit)], call=call)[time_window]
+
+
+def search_news_around_call_multi(
+    call_id: str,
+    windows: Sequence[Tuple[str, Optional[int]]],
+    call: Optional[Dict] = None
+) -> Dict[str, List[Dict]]:
+    """
+    Search several news windows around a call in one query.
+    
+    Each window becomes a tagged SELECT; they are combined with UNION ALL
+    so all windows cost a single round trip.
+    
+    Args:
+        call_id: Unique identifier (e.g., 'earnings:nvda:q2-fy2026')
+        windows: (time_window, limit) pairs, e.g. [("pre-call", 20), ("post-24h", 20)]
+        call: Already-loaded get_earnings_call() result (skips the lookup)
+    
+    Returns:
+        Dict mapping each time_window to its articles (published_utc DESC)
+    
+    Raises:
+        ValueError: If call_id or a time_window is unknown
+    
+    Example:
+        >>> news = search_news_around_call_multi(
+        ...     "earnings:nvda:q2-fy2026", [("pre-call", 20), ("post-24h", 20)]
+        ... )
+        >>> print(len(news["pre-call"]), len(news["post-24h"]))
+    """
+    for name, _ in windows:
+        if name not in NEWS_WINDOWS:
+            raise ValueError(
+                f"Invalid time_window: {name} (expected one of {', '.join(NEWS_WINDOWS)})"
+            )
+    
+    if call is None:
+        call = get_earnings_call(call_id)  # Raises ValueError if not found
+    call_start = call['call_start_utc']
+    
+    parts = []
+    params = []
+    for name, limit in windows:
+        start_offset, end_offset = NEWS_WINDOWS[name]
+        part = """
+            SELECT %s::text AS time_window,
+                id, title, description, url, published_utc, source, tickers, full_body
+            FROM news_raw
+            WHERE tickers @> ARRAY[%s]::text[]
+              AND published_utc >= %s
+              AND published_utc < %s
+            ORDER BY published_utc DESC
+        """
+        params += [name, call['ticker'], call_start + start_offset, call_start + end_offset]
+        if limit:
+            part += " LIMIT %s"
+            params.append(limit)
+        parts.append(f"({part})")
+    
+    results: Dict[str, List[Dict]] = {name: [] for name, _ in windows}
+    if not parts:
+        return results
+    
+    try:
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(" UNION ALL ".join(parts), params)
+                
+                for row in cur.fetchall():
+                    results[row[0]].append({
+                        "id": row[1],
+                        "title": row[2],
+                        "description": row[3],
+                        "url": row[4],
+                        "published_utc": row[5],
+                        "source": row[6],
+                        "tickers": row[7],
+                        "full_body": row[8]
+                    })
+                
+                return results
+    
+    except psycopg2.Error as e:
+        raise psycopg2.Error(f"Database error: {e}")
+
+
 def get_analyst_questions(call_id: str) -> list:
     """
     Retrieve only analyst questions from Q&A section.
@@ -383,7 +571,7 @@ def get_speaker_interventions(
     query += " ORDER BY sequence_order"
     
     try:
-        with psycopg2.connect(PG_DSN) as conn:
+        with get_conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, params)
                 results = cur.fetchall()
@@ -424,13 +612,22 @@ def get_question_answer_pairs(call_id: str) -> list:
         >>>     print(f"Q: {pair['question']['analyst_firm']}")
         >>>     print(f"A: {len(pair['answers'])} responses")
     """
-    questions = get_analyst_questions(call_id)
-    
+    # Load the Q&A section once and link answers in memory
+    # (instead of one get_management_answers round trip per question)
+    qa = get_qa_section(call_id)
+    questions = [i for i in qa if i['is_question']]
+    all_answers = [i for i in qa if i['is_answer']]
+
+    answers_by_question = {}
+    for a in all_answers:
+        answers_by_question.setdefault(a['question_id'], []).append(a)
+
     pairs = []
     for question in questions:
         q_id = question['sequence_order']
-        answers = get_management_answers(call_id, question_id=q_id)
-        
+        # Same semantics as get_management_answers: no id -> no filtering
+        answers = answers_by_question.get(q_id, []) if q_id else list(all_answers)
+
         pairs.append({
             'question': question,
             'answers': answers
@@ -467,7 +664,7 @@ def get_press_release(call_id: str) -> dict:
     """
     
     try:
-        with psycopg2.connect(PG_DSN) as conn:
+        with get_conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, (call_id,))
                 result = cur.fetchone()
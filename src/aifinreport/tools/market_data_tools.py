@@ -4,6 +4,7 @@ Market data tools for fetching stock prices.
 Uses Massive.com API for OHLC data.
 """
 import os
+import orjson
 import requests
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict
@@ -15,6 +16,9 @@ load_dotenv()
 # Get API key from environment
 MASSIVE_API_KEY = os.getenv('MASSIVE_API_KEY')
 
+# Shared session: reuses the TCP/TLS connection across bar requests
+_session = requests.Session()
+
 
 def fetch_ohlc_bars(
     ticker: str,
@@ -111,10 +115,10 @@ def fetch_ohlc_bars(
     }
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _session.get(url, headers=headers, params=params, timeout=30)
         response.raise_for_status()
         
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Handle DELAYED status gracefully (future dates or data not yet available)
         if data.get('status') == 'DELAYED':
@@ -0,0 +1,5 @@
+import os
+
+# Unit tests never connect; name the driver so importing
+# aifinreport.database.connection doesn't depend on SQLAlchemy's default
+os.environ.setdefault("PG_DSN", "postgresql+psycopg2:///finreport")
@@ -0,0 +1,45 @@
+import pytest
+
+from aifinreport.analysis.selection import (
+    FINANCIAL_KEYWORDS,
+    _distinct_keywords,
+    calculate_article_score,
+    score_articles,
+)
+
+TEXTS = [
+    "",
+    "nothing to see here",
+    "nvidia quarterly results beat estimates",          # quarterly ⊃ quarter
+    "price target raised; revenue up 12% to $35 billion",
+    "deliveries fell; production fall; falling sales",  # deliveries ⊃ delivery
+    "eps eps eps",
+    "the leadership fy25 outlook",
+    "balance sheet and cash flow: margin expansion in q3",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_distinct_keywords_matches_substring_scan(text):
+    assert _distinct_keywords(text) == {kw for kw in FINANCIAL_KEYWORDS if kw in text}
+
+
+def test_score_articles_matches_scalar_score():
+    articles = [
+        {
+            "title": title.title(),
+            "description": TEXTS[(i + 3) % len(TEXTS)],
+            "summary": TEXTS[(i + 5) % len(TEXTS)] if i % 2 else None,
+            "full_body_chars": n,
+        }
+        for i, (title, n) in enumerate(
+            zip(TEXTS, [None, 0, 500, 501, 1500, 2500, 4000, 9000])
+        )
+    ]
+    
+    expected = [calculate_article_score(a) for a in articles]
+    assert score_articles(articles).tolist() == pytest.approx(expected, abs=1e-6)
+
+
+def test_score_articles_empty():
+    assert len(score_articles([])) == 0
@@ -0,0 +1,52 @@
+import pytest
+
+from aifinreport.analysis.summarization import group_paragraphs
+from aifinreport.ingestion.summarizers import split_into_paragraphs
+
+LONG = "x" * 101
+EXACT = "y" * 100
+
+
+def _split_reference(text):
+    return [p.strip() for p in text.split("\n") if len(p.strip()) > 100]
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    EXACT,
+    LONG,
+    f"  {LONG}  \n\n{EXACT}\n\t{LONG}\t",
+    f"{LONG}\r\n{LONG}\r\n",
+    f" {EXACT} \n{'z' * 99} a\n",
+    f"{'a ' * 60}\n\n\n{'b' * 50}",
+    f"\x0c{LONG}\x0b\n{LONG}",
+])
+def test_split_into_paragraphs_matches_reference(text):
+    assert split_into_paragraphs(text) == _split_reference(text)
+
+
+def test_group_paragraphs_packs_every_paragraph_once():
+    paras = [f"p{i}-" + "w" * n for i, n in enumerate([900, 200, 1500, 50, 700, 300, 1700])]
+    chunks = group_paragraphs(paras, max_chars=1800)
+    
+    parts = [p for c in chunks for p in c.split("\n\n")]
+    assert sorted(parts) == sorted(paras)
+    
+    # Each chunk fits (with separators) and keeps the input order
+    for chunk in chunks:
+        members = chunk.split("\n\n")
+        assert sum(len(p) + 2 for p in members) <= 1800
+        assert members == sorted(members, key=paras.index)
+    
+    # Chunks are ordered by their earliest paragraph
+    firsts = [paras.index(c.split("\n\n")[0]) for c in chunks]
+    assert firsts == sorted(firsts)
+
+
+def test_group_paragraphs_oversized_paragraph_gets_its_own_chunk():
+    big = "b" * 5000
+    assert group_paragraphs(["a" * 10, big], max_chars=1800) == ["a" * 10, big]
+
+
+def test_group_paragraphs_empty():
+    assert group_paragraphs([]) == []
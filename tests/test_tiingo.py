@@ -0,0 +1,53 @@
+import pytest
+
+from aifinreport.ingestion.tiingo import _UPSERT_COLUMNS, _copy_buffer, _pg_array
+
+
+@pytest.mark.parametrize("values, expected", [
+    (None, None),
+    ([], "{}"),
+    (["NVDA"], '{"NVDA"}'),
+    (["a", "b"], '{"a","b"}'),
+    (["a,b"], '{"a,b"}'),
+    (['say "hi"'], '{"say \\"hi\\""}'),
+    (["back\\slash"], '{"back\\\\slash"}'),
+    ([""], '{""}'),
+    (["NULL"], '{"NULL"}'),
+])
+def test_pg_array(values, expected):
+    assert _pg_array(values) == expected
+
+
+def _row(**fields):
+    return tuple(fields.get(c) for c in _UPSERT_COLUMNS)
+
+
+def test_copy_buffer_null_vs_text():
+    line = _copy_buffer([_row(
+        id="tiingo:1",
+        title="",
+        description="\\N",
+        full_body_chars=0,
+        tickers=["NVDA"],
+        tags=[],
+    )]).read()
+    
+    fields = dict(zip(_UPSERT_COLUMNS, line.rstrip("\n").split(",")))
+    assert fields["id"] == '"tiingo:1"'
+    assert fields["published_utc"] == ""        # None -> unquoted empty = NULL
+    assert fields["title"] == '""'              # '' stays an empty string
+    assert fields["description"] == '"\\N"'     # quoted, so never read as NULL
+    assert fields["full_body_chars"] == "0"
+    assert fields["tickers"] == '"{""NVDA""}"'
+    assert fields["tags"] == '"{}"'
+
+
+def test_copy_buffer_quotes_commas_quotes_and_newlines():
+    buf = _copy_buffer([
+        _row(id="tiingo:1", title='Q3 "beat", shares up\nagain'),
+        _row(id="tiingo:2"),
+    ])
+    lines = buf.read()
+    
+    assert '"Q3 ""beat"", shares up\nagain"' in lines
+    assert lines.endswith('"tiingo:2"' + "," * (len(_UPSERT_COLUMNS) - 1) + "\n")